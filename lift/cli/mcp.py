@@ -10,9 +10,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from lift.mcp.config import get_config_path, load_config
-from lift.mcp.server import start_server
-
 
 mcp_app = typer.Typer(name="mcp", help="MCP server management commands")
 console = Console()
@@ -42,6 +39,9 @@ def start(
         )
     )
 
+    # The MCP SDK is slow to import; load it only when a server is started
+    from lift.mcp.server import start_server
+
     try:
         asyncio.run(start_server())
     except KeyboardInterrupt:
@@ -85,6 +85,8 @@ def info() -> None:
 
     Displays the configuration file location and current settings.
     """
+    from lift.mcp.config import get_config_path, load_config
+
     config_path = get_config_path()
     config = load_config()
 
@@ -1,29 +1,74 @@
 """Database connection and management using DuckDB."""
 
 import os
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 
 import duckdb
 
 
+ConnectionConfig = dict[str, str | bool | int | float | list[str]]
+
+# Open connections keyed by database path, shared by managers that reuse connections
+_connection_cache: dict[str, duckdb.DuckDBPyConnection] = {}
+_connection_cache_lock = threading.Lock()
+
+# Set by enable_connection_reuse(); read when a DatabaseManager is created
+_reuse_connections = False
+_reuse_config: ConnectionConfig = {}
+
+
+@cache
+def _load_schema_sql() -> str:
+    """Read schema.sql once per process; it is applied as a single multi-statement script."""
+    schema_path = Path(__file__).parent / "schema.sql"
+
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+
+    return schema_path.read_text()
+
+
 class DatabaseManager:
     """Manages DuckDB database connection and operations."""
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config: ConnectionConfig | None = None,
+        reuse_connection: bool | None = None,
+    ) -> None:
         """
         Initialize database manager.
 
         Args:
-            db_path: Path to database file. If None, uses default ~/.lift/lift.duckdb
+            db_path: Path to database file. If None, uses default ~/.lift/lift.duckdb.
+                ":memory:" keeps a private in-memory database for the life of the manager.
+            config: DuckDB configuration options passed to every connection. If None,
+                uses the config given to enable_connection_reuse() when this manager
+                reuses connections and DuckDB's defaults otherwise.
+            reuse_connection: Keep one connection per database path open until
+                close_cached_connections(). If None, follows enable_connection_reuse().
         """
         if db_path is None:
             db_path = self._get_default_db_path()
 
         self.db_path = Path(db_path).expanduser()
-        self._ensure_db_directory()
+        self._in_memory = db_path == ":memory:"
+        if not self._in_memory:
+            self._ensure_db_directory()
         self._connection: duckdb.DuckDBPyConnection | None = None
+        if reuse_connection is None:
+            reuse_connection = _reuse_connections
+        self._reuse_connection = reuse_connection
+        # Connection of the outermost get_connection() block running in each thread
+        self._local = threading.local()
+        if config is None:
+            config = _reuse_config if reuse_connection else {}
+        self._config = config
 
     def _get_default_db_path(self) -> str:
         """Get the default database path from environment or use ~/.lift/lift.duckdb."""
@@ -46,10 +91,37 @@ class DatabaseManager:
             >>> with db.get_connection() as conn:
             ...     result = conn.execute("SELECT * FROM exercises").fetchall()
         """
-        conn = duckdb.connect(str(self.db_path))
+        if self._in_memory:
+            # Each connect(":memory:") opens a new empty database, so hold on to one
+            if self._connection is None:
+                self._connection = duckdb.connect(":memory:", config=self._config)
+            yield self._connection
+            return
+
+        if self._reuse_connection:
+            # Keep the connection open until close_cached_connections()
+            key = str(self.db_path)
+            with _connection_cache_lock:
+                cached = _connection_cache.get(key)
+                if cached is None:
+                    cached = duckdb.connect(key, config=self._config)
+                    _connection_cache[key] = cached
+            yield cached
+            return
+
+        # Nested blocks in the same thread (e.g. one service calling another) share
+        # the outer connection; it is closed when the outermost block exits
+        active = getattr(self._local, "connection", None)
+        if active is not None:
+            yield active
+            return
+
+        conn = duckdb.connect(str(self.db_path), config=self._config)
+        self._local.connection = conn
         try:
             yield conn
         finally:
+            self._local.connection = None
             conn.close()
 
     def execute(self, query: str, parameters: tuple | None = None) -> list:
@@ -87,13 +159,7 @@ class DatabaseManager:
 
         This will create all tables, indexes, and views defined in schema.sql.
         """
-        schema_path = Path(__file__).parent / "schema.sql"
-
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        with open(schema_path) as f:
-            schema_sql = f.read()
+        schema_sql = _load_schema_sql()
 
         with self.get_connection() as conn:
             # Execute the entire schema
@@ -124,7 +190,7 @@ class DatabaseManager:
 
     def database_exists(self) -> bool:
         """Check if the database file exists and is initialized."""
-        if not self.db_path.exists():
+        if not self._in_memory and not self.db_path.exists():
             return False
 
         # Check if key tables exist
@@ -204,9 +270,12 @@ class DatabaseManager:
                 count = count_result[0] if count_result else 0
                 table_info[table_name] = count
 
+            # An in-memory database has no file to measure
+            size_mb = 0.0 if self._in_memory else self.db_path.stat().st_size / (1024 * 1024)
+
             return {
                 "database_path": str(self.db_path),
-                "database_size_mb": self.db_path.stat().st_size / (1024 * 1024),
+                "database_size_mb": size_mb,
                 "tables": table_info,
             }
 
@@ -233,7 +302,33 @@ def get_db(db_path: str | None = None) -> DatabaseManager:
     return _db_instance
 
 
+def enable_connection_reuse(enabled: bool = True, config: ConnectionConfig | None = None) -> None:
+    """
+    Make DatabaseManagers created from now on share one open connection per path.
+
+    Meant for test suites that open many short-lived managers on throwaway files.
+    Shared connections stay open until close_cached_connections().
+
+    Args:
+        enabled: Whether new managers reuse connections
+        config: DuckDB configuration for new managers created without their own
+    """
+    global _reuse_connections, _reuse_config
+    _reuse_connections = enabled
+    _reuse_config = config or {}
+
+
+def close_cached_connections() -> None:
+    """Close connections shared under enable_connection_reuse(), checkpointing their files."""
+    with _connection_cache_lock:
+        connections = list(_connection_cache.values())
+        _connection_cache.clear()
+    for conn in connections:
+        conn.close()
+
+
 def reset_db_instance() -> None:
     """Reset the global database instance. Useful for testing."""
     global _db_instance
     _db_instance = None
+    close_cached_connections()
@@ -12,6 +12,58 @@ from lift.core.models import (
 )
 
 
+# Numeric fields compared between two measurements
+COMPARABLE_FIELDS = (
+    "weight",
+    "body_fat_pct",
+    "neck",
+    "shoulders",
+    "chest",
+    "waist",
+    "hips",
+    "bicep_left",
+    "bicep_right",
+    "forearm_left",
+    "forearm_right",
+    "thigh_left",
+    "thigh_right",
+    "calf_left",
+    "calf_right",
+)
+
+# Columns of a body_measurements row, in the order _row_to_measurement expects
+_MEASUREMENT_COLUMNS = (
+    "id",
+    "date",
+    "weight",
+    "weight_unit",
+    "body_fat_pct",
+    "neck",
+    "shoulders",
+    "chest",
+    "waist",
+    "hips",
+    "bicep_left",
+    "bicep_right",
+    "forearm_left",
+    "forearm_right",
+    "thigh_left",
+    "thigh_right",
+    "calf_left",
+    "calf_right",
+    "measurement_unit",
+    "notes",
+)
+
+# Select list for joining two measurements: both sides aliased by prefix, plus the
+# per-field differences (a - b) computed by DuckDB
+_COMPARISON_COLUMNS = ", ".join(
+    [f"a.{column} AS a_{column}" for column in _MEASUREMENT_COLUMNS]
+    + [f"b.{column} AS b_{column}" for column in _MEASUREMENT_COLUMNS]
+    + [f"a.{field} - b.{field} AS change_{field}" for field in COMPARABLE_FIELDS]
+)
+
+
 class BodyService:
     """Service for managing body measurements and tracking progress."""
 
@@ -290,52 +342,18 @@ class BodyService:
                 }
             }
         """
-        query = "SELECT * FROM body_measurements WHERE id = ?"
+        query = f"""
+            SELECT {_COMPARISON_COLUMNS}
+            FROM body_measurements a, body_measurements b
+            WHERE a.id = ? AND b.id = ?
+        """  # nosec B608  # comparison columns built from fixed column lists
 
-        result1 = self.db.execute(query, (measurement1_id,))
-        result2 = self.db.execute(query, (measurement2_id,))
+        row = self._fetch_comparison(query, (measurement1_id, measurement2_id))
 
-        if not result1 or not result2:
+        if row is None:
             raise ValueError("One or both measurements not found")
 
-        m1 = self._row_to_measurement(result1[0])
-        m2 = self._row_to_measurement(result2[0])
-
-        differences = {}
-
-        # Compare all numeric fields
-        fields_to_compare = [
-            ("weight", "weight"),
-            ("body_fat_pct", "body_fat_pct"),
-            ("neck", "neck"),
-            ("shoulders", "shoulders"),
-            ("chest", "chest"),
-            ("waist", "waist"),
-            ("hips", "hips"),
-            ("bicep_left", "bicep_left"),
-            ("bicep_right", "bicep_right"),
-            ("forearm_left", "forearm_left"),
-            ("forearm_right", "forearm_right"),
-            ("thigh_left", "thigh_left"),
-            ("thigh_right", "thigh_right"),
-            ("calf_left", "calf_left"),
-            ("calf_right", "calf_right"),
-        ]
-
-        for field_name, attr_name in fields_to_compare:
-            val1 = getattr(m1, attr_name)
-            val2 = getattr(m2, attr_name)
-
-            if val1 is not None and val2 is not None:
-                change = val1 - val2
-                percent_change = (change / val2 * 100) if val2 != 0 else Decimal("0")
-
-                differences[field_name] = {
-                    "current": val1,
-                    "previous": val2,
-                    "change": change,
-                    "percent": percent_change,
-                }
+        m1, m2, differences = self._row_to_comparison(row)
 
         return {
             "measurement1": m1,
@@ -362,37 +380,45 @@ class BodyService:
                 'differences': {...}
             }
         """
-        latest = self.get_latest_measurement()
-        if not latest:
-            raise ValueError("No measurements found")
-
         # Find measurement closest to X weeks ago
         target_date = datetime.now() - timedelta(weeks=weeks_back)
 
-        query = """
-            SELECT * FROM body_measurements
-            WHERE date <= ?
-            ORDER BY date DESC
-            LIMIT 1
-        """
-        result = self.db.execute(query, (target_date,))
+        query = f"""
+            WITH latest AS (
+                SELECT * FROM body_measurements
+                ORDER BY date DESC
+                LIMIT 1
+            ),
+            previous AS (
+                SELECT * FROM body_measurements
+                WHERE date <= ?
+                ORDER BY date DESC
+                LIMIT 1
+            )
+            SELECT {_COMPARISON_COLUMNS}
+            FROM latest a
+            LEFT JOIN previous b ON TRUE
+        """  # nosec B608  # comparison columns built from fixed column lists
+        row = self._fetch_comparison(query, (target_date,))
+
+        if row is None:
+            raise ValueError("No measurements found")
 
-        if not result:
+        # LEFT JOIN leaves the previous measurement's columns NULL when none matched
+        if row["b_id"] is None:
             raise ValueError(f"No measurements found from {weeks_back} weeks ago")
 
-        previous = self._row_to_measurement(result[0])
+        latest, previous, differences = self._row_to_comparison(row)
 
         # Calculate actual weeks apart
         days_apart = (latest.date - previous.date).days
         actual_weeks = days_apart / 7
 
-        comparison = self.compare_measurements(latest.id, previous.id)
-
         return {
             "current": latest,
             "previous": previous,
             "weeks_apart": round(actual_weeks, 1),
-            "differences": comparison["differences"],
+            "differences": differences,
         }
 
     def get_seven_day_average(self, field: str = "weight") -> Decimal | None:
@@ -441,6 +467,48 @@ class BodyService:
             return Decimal(str(result[0][0])).quantize(Decimal("0.1"))
         return None
 
+    def _fetch_comparison(self, query: str, parameters: tuple) -> dict | None:
+        """Run a comparison query and return its first row keyed by column alias."""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(query, parameters)
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(zip([column[0] for column in cursor.description], row, strict=True))
+
+    def _row_to_comparison(
+        self, row: dict
+    ) -> tuple[BodyMeasurement, BodyMeasurement, dict[str, dict[str, Decimal]]]:
+        """
+        Split a comparison row into both measurements and their differences.
+
+        Columns are looked up by the ``a_``, ``b_`` and ``change_`` aliases from
+        ``_COMPARISON_COLUMNS``.
+        """
+        m1 = self._row_to_measurement(tuple(row[f"a_{column}"] for column in _MEASUREMENT_COLUMNS))
+        m2 = self._row_to_measurement(tuple(row[f"b_{column}"] for column in _MEASUREMENT_COLUMNS))
+
+        differences = {}
+        for field_name in COMPARABLE_FIELDS:
+            raw_change = row[f"change_{field_name}"]
+            # NULL whenever either side is missing the field
+            if raw_change is None:
+                continue
+
+            current = getattr(m1, field_name)
+            previous = getattr(m2, field_name)
+            change = Decimal(str(raw_change))
+            percent_change = (change / previous * 100) if previous != 0 else Decimal("0")
+
+            differences[field_name] = {
+                "current": current,
+                "previous": previous,
+                "change": change,
+                "percent": percent_change,
+            }
+
+        return m1, m2, differences
+
     def _row_to_measurement(self, row: tuple) -> BodyMeasurement:
         """Convert database row to BodyMeasurement model."""
         return BodyMeasurement(
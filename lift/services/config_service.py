@@ -7,7 +7,14 @@ from lift.core.models import MeasurementUnit, Setting, WeightUnit
 
 
 class ConfigService:
-    """Service for managing application configuration settings."""
+    """
+    Service for managing application configuration settings.
+
+    Values read through get_setting are cached per instance. Only writes made through
+    the same instance invalidate that cache, so a long-lived service will not see
+    settings changed by another ConfigService or by direct SQL; create a new instance
+    (or call one of its write methods) to pick those up.
+    """
 
     # Default settings
     DEFAULT_SETTINGS = {
@@ -28,6 +35,8 @@ class ConfigService:
             db: Database manager instance
         """
         self.db = db
+        # Values already read through get_setting; writes through this service invalidate them
+        self._cache: dict[str, str | None] = {}
 
     def get_setting(self, key: str) -> str | None:
         """
@@ -39,14 +48,16 @@ class ConfigService:
         Returns:
             Setting value or None if not found
         """
+        if key in self._cache:
+            return self._cache[key]
+
         with self.db.get_connection() as conn:
             result = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
 
-            if result:
-                return str(result[0])
-
-            # Return default if exists
-            return self.DEFAULT_SETTINGS.get(key)
+        # Fall back to the default if one exists
+        value = str(result[0]) if result else self.DEFAULT_SETTINGS.get(key)
+        self._cache[key] = value
+        return value
 
     def set_setting(self, key: str, value: str, description: str | None = None) -> Setting:
         """
@@ -62,6 +73,8 @@ class ConfigService:
         Returns:
             Updated Setting object
         """
+        self._cache.pop(key, None)
+
         with self.db.get_connection() as conn:
             # Check if setting exists
             existing = conn.execute("SELECT key FROM settings WHERE key = ?", (key,)).fetchone()
@@ -156,6 +169,8 @@ class ConfigService:
         Returns:
             True if setting was deleted, False if it didn't exist
         """
+        self._cache.pop(key, None)
+
         with self.db.get_connection() as conn:
             # Check if setting exists
             existing = conn.execute("SELECT key FROM settings WHERE key = ?", (key,)).fetchone()
@@ -173,6 +188,8 @@ class ConfigService:
 
         This will delete all custom settings and restore defaults.
         """
+        self._cache.clear()
+
         with self.db.get_connection() as conn:
             # Delete all settings
             conn.execute("DELETE FROM settings")
@@ -7,6 +7,36 @@ from lift.core.database import DatabaseManager, get_db
 from lift.core.models import Exercise, ExerciseCreate
 
 
+_INSERT_EXERCISES = """
+    INSERT INTO exercises (
+        name, category, primary_muscle, secondary_muscles,
+        equipment, movement_type, is_custom, instructions, video_url
+    )
+    VALUES
+"""
+
+# One VALUES row of _INSERT_EXERCISES
+_EXERCISE_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def _exercise_params(exercise: ExerciseCreate) -> tuple:
+    """Build the _EXERCISE_ROW parameters for one exercise."""
+    # Convert secondary_muscles list to JSON string
+    secondary_muscles_json = json.dumps([muscle.value for muscle in exercise.secondary_muscles])
+
+    return (
+        exercise.name,
+        exercise.category.value,
+        exercise.primary_muscle.value,
+        secondary_muscles_json,
+        exercise.equipment.value,
+        exercise.movement_type.value,
+        exercise.is_custom,
+        exercise.instructions,
+        exercise.video_url,
+    )
+
+
 class ExerciseService:
     """Service for managing exercises."""
 
@@ -128,31 +158,10 @@ class ExerciseService:
         if existing:
             raise ValueError(f"Exercise '{exercise.name}' already exists")
 
-        # Convert secondary_muscles list to JSON string
-        secondary_muscles_json = json.dumps([muscle.value for muscle in exercise.secondary_muscles])
-
-        sql = """
-            INSERT INTO exercises (
-                name, category, primary_muscle, secondary_muscles,
-                equipment, movement_type, is_custom, instructions, video_url
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        params = (
-            exercise.name,
-            exercise.category.value,
-            exercise.primary_muscle.value,
-            secondary_muscles_json,
-            exercise.equipment.value,
-            exercise.movement_type.value,
-            exercise.is_custom,
-            exercise.instructions,
-            exercise.video_url,
-        )
+        sql = f"{_INSERT_EXERCISES} {_EXERCISE_ROW}"
 
         with self.db.get_connection() as conn:
-            conn.execute(sql, params)
+            conn.execute(sql, _exercise_params(exercise))
 
         # Retrieve the created exercise
         created = self.get_by_name(exercise.name)
@@ -161,6 +170,50 @@ class ExerciseService:
 
         return created
 
+    def create_many(self, exercises: list[ExerciseCreate]) -> int:
+        """
+        Create several exercises with one multi-row INSERT.
+
+        Unlike create, the created rows are not read back.
+
+        Args:
+            exercises: ExerciseCreate objects
+
+        Returns:
+            Number of exercises created
+
+        Raises:
+            ValueError: If a name is listed twice or an exercise with it already exists
+        """
+        if not exercises:
+            return 0
+
+        names = [exercise.name.lower() for exercise in exercises]
+
+        # Catch duplicates within the batch before the INSERT trips the unique constraint
+        seen: set[str] = set()
+        for exercise, name in zip(exercises, names, strict=True):
+            if name in seen:
+                raise ValueError(f"Exercise '{exercise.name}' is listed more than once")
+            seen.add(name)
+
+        placeholders = ", ".join(["?" for _ in names])
+
+        with self.db.get_connection() as conn:
+            # Check if any exercise already exists
+            existing = conn.execute(
+                f"SELECT name FROM exercises WHERE LOWER(name) IN ({placeholders}) LIMIT 1",  # nosec B608  # placeholders only
+                names,
+            ).fetchone()
+            if existing:
+                raise ValueError(f"Exercise '{existing[0]}' already exists")
+
+            sql = _INSERT_EXERCISES + ", ".join([_EXERCISE_ROW] * len(exercises))
+            params = [value for exercise in exercises for value in _exercise_params(exercise)]
+            conn.execute(sql, params)
+
+        return len(exercises)
+
     def delete(self, exercise_id: int) -> bool:
         """
         Delete an exercise by ID.
@@ -191,12 +244,13 @@ class ExerciseService:
 
         return True
 
-    def load_seed_exercises(self, force: bool = False) -> int:
+    def load_seed_exercises(self, force: bool = False, exercises_file: str | None = None) -> int:
         """
         Load seed exercises from JSON file.
 
         Args:
             force: If True, reload even if exercises already exist
+            exercises_file: Path to exercises JSON file. If None, uses default.
 
         Returns:
             Number of exercises loaded
@@ -211,7 +265,10 @@ class ExerciseService:
                 return 0  # Skip loading if exercises already exist
 
         # Load exercises from JSON file
-        json_path = Path(__file__).parent.parent / "data" / "exercises.json"
+        if exercises_file is None:
+            exercises_file = str(Path(__file__).parent.parent / "data" / "exercises.json")
+
+        json_path = Path(exercises_file)
 
         if not json_path.exists():
             raise FileNotFoundError(f"Exercises data file not found: {json_path}")
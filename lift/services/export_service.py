@@ -1,15 +1,30 @@
 """Service for exporting data from the LIFT database."""
 
 import csv
-import json
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+import orjson
 
 from lift.core.database import DatabaseManager
 
 
+def _dumps_json(data: Any) -> bytes:
+    """Serialize export data as indented UTF-8 JSON."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a database value that JSON cannot represent directly."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
 class ExportService:
     """Service for exporting workout data in various formats."""
 
@@ -147,49 +162,23 @@ class ExportService:
         output_path_obj = Path(output_path).expanduser()
         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.db.get_connection() as conn:
-            # Verify table exists
-            tables = conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' AND table_name = ?",
-                (table_name,),
-            ).fetchall()
-
-            if not tables:
-                raise ValueError(f"Table '{table_name}' does not exist")
+        data = self._table_to_json_data(table_name)
 
-            # Get all data from the table
-            result = conn.execute(f"SELECT * FROM {table_name}").fetchall()  # nosec B608  # table_name validated
-
-            # Convert to list of dictionaries
-            data = []
-            for row in result:
-                if hasattr(row, "_asdict"):
-                    row_dict = dict(row._asdict())
-                else:
-                    # Fallback: get column names
-                    columns = conn.execute(
-                        f"SELECT column_name FROM information_schema.columns "  # nosec B608  # table_name validated
-                        f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"
-                    ).fetchall()
-                    headers = [col[0] for col in columns]
-                    row_dict = dict(zip(headers, row, strict=False))
+        # Write to JSON
+        output_path_obj.write_bytes(_dumps_json(data))
 
-                # Convert timestamps and Decimals for JSON serialization
-                processed_dict: dict[str, str | float | int | None] = {}
-                for key, value in row_dict.items():
-                    if isinstance(value, datetime):
-                        processed_dict[key] = value.isoformat()
-                    elif isinstance(value, Decimal):
-                        processed_dict[key] = float(value)
-                    else:
-                        processed_dict[key] = value
+    def export_to_json_stream(self, table_name: str, stream: TextIO) -> None:
+        """
+        Export a specific table as JSON to an open text stream.
 
-                data.append(processed_dict)
+        Args:
+            table_name: Name of the table to export
+            stream: Writable text stream, e.g. an open file or io.StringIO
 
-        # Write to JSON
-        with open(output_path_obj, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Raises:
+            ValueError: If table doesn't exist
+        """
+        stream.write(_dumps_json(self._table_to_json_data(table_name)).decode("utf-8"))
 
     def export_all_to_json(self, output_path: str) -> dict[str, int]:
         """
@@ -204,60 +193,25 @@ class ExportService:
         output_path_obj = Path(output_path).expanduser()
         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.db.get_connection() as conn:
-            # Get all table names
-            tables = conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' AND table_type = 'BASE TABLE' "
-                "ORDER BY table_name"
-            ).fetchall()
-
-            database_export: dict[str, Any] = {
-                "export_date": datetime.now().isoformat(),
-                "tables": {},
-            }
-
-            export_summary = {}
+        database_export, export_summary = self._database_to_json_data()
 
-            for table_tuple in tables:
-                table_name = table_tuple[0]
-
-                # Get all data from the table
-                result = conn.execute(f"SELECT * FROM {table_name}").fetchall()  # nosec B608  # table_name from schema
-
-                # Convert to list of dictionaries
-                data = []
-                for row in result:
-                    if hasattr(row, "_asdict"):
-                        row_dict = dict(row._asdict())
-                    else:
-                        # Fallback: get column names
-                        columns = conn.execute(
-                            f"SELECT column_name FROM information_schema.columns "  # nosec B608  # table_name from schema
-                            f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"
-                        ).fetchall()
-                        headers = [col[0] for col in columns]
-                        row_dict = dict(zip(headers, row, strict=False))
-
-                    # Convert timestamps and Decimals for JSON serialization
-                    processed_dict: dict[str, str | float | int | None] = {}
-                    for key, value in row_dict.items():
-                        if isinstance(value, datetime):
-                            processed_dict[key] = value.isoformat()
-                        elif isinstance(value, Decimal):
-                            processed_dict[key] = float(value)
-                        else:
-                            processed_dict[key] = value
+        # Write to JSON
+        output_path_obj.write_bytes(_dumps_json(database_export))
 
-                    data.append(processed_dict)
+        return export_summary
 
-                database_export["tables"][table_name] = data
-                export_summary[table_name] = len(data)
+    def export_all_to_json_stream(self, stream: TextIO) -> dict[str, int]:
+        """
+        Export entire database as JSON to an open text stream.
 
-        # Write to JSON
-        with open(output_path_obj, "w", encoding="utf-8") as f:
-            json.dump(database_export, f, indent=2, ensure_ascii=False)
+        Args:
+            stream: Writable text stream, e.g. an open file or io.StringIO
 
+        Returns:
+            Dictionary mapping table names to row counts
+        """
+        database_export, export_summary = self._database_to_json_data()
+        stream.write(_dumps_json(database_export).decode("utf-8"))
         return export_summary
 
     def export_workout_history(
@@ -328,7 +282,7 @@ class ExportService:
 
                 # Convert workout data
                 processed_workout: dict[
-                    str, str | int | float | None | list[dict[str, str | int | float | None]]
+                    str, str | int | float | list[dict[str, str | int | float | None]] | None
                 ] = {}
                 for key, value in workout_dict.items():
                     if isinstance(value, datetime):
@@ -360,7 +314,94 @@ class ExportService:
         }
 
         # Write to JSON
-        with open(output_path_obj, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        output_path_obj.write_bytes(_dumps_json(export_data))
 
         return len(workout_data)
+
+    def _table_to_json_data(self, table_name: str) -> list[dict[str, str | float | int | None]]:
+        """
+        Read a table into JSON-serializable rows.
+
+        Args:
+            table_name: Name of the table to read
+
+        Returns:
+            One dictionary per row
+
+        Raises:
+            ValueError: If table doesn't exist
+        """
+        with self.db.get_connection() as conn:
+            # Verify table exists
+            tables = conn.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' AND table_name = ?",
+                (table_name,),
+            ).fetchall()
+
+            if not tables:
+                raise ValueError(f"Table '{table_name}' does not exist")
+
+            # Get all data from the table
+            result = conn.execute(f"SELECT * FROM {table_name}").fetchall()  # nosec B608  # table_name validated
+
+            # Convert to list of dictionaries
+            data = []
+            for row in result:
+                if hasattr(row, "_asdict"):
+                    row_dict = dict(row._asdict())
+                else:
+                    # Fallback: get column names
+                    columns = conn.execute(
+                        f"SELECT column_name FROM information_schema.columns "  # nosec B608  # table_name validated
+                        f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"
+                    ).fetchall()
+                    headers = [col[0] for col in columns]
+                    row_dict = dict(zip(headers, row, strict=False))
+
+                # Convert timestamps and Decimals for JSON serialization
+                data.append({key: _json_value(value) for key, value in row_dict.items()})
+
+        return data
+
+    def _database_to_json_data(self) -> tuple[dict[str, Any], dict[str, int]]:
+        """
+        Read every table into a JSON-serializable export document.
+
+        Column names come from the cursor description, so each table costs one query.
+
+        Returns:
+            Tuple of (export document, mapping of table names to row counts)
+        """
+        with self.db.get_connection() as conn:
+            # Get all table names
+            tables = conn.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' AND table_type = 'BASE TABLE' "
+                "ORDER BY table_name"
+            ).fetchall()
+
+            database_export: dict[str, Any] = {
+                "export_date": datetime.now().isoformat(),
+                "tables": {},
+            }
+
+            export_summary = {}
+
+            for table_tuple in tables:
+                table_name = table_tuple[0]
+
+                # Get all data from the table
+                cursor = conn.execute(f"SELECT * FROM {table_name}")  # nosec B608  # table_name from schema
+                headers = [column[0] for column in cursor.description]
+
+                # Convert timestamps and Decimals for JSON serialization
+                data = [
+                    {key: _json_value(value) for key, value in zip(headers, row, strict=True)}
+                    for row in cursor.fetchall()
+                ]
+
+                database_export["tables"][table_name] = data
+                export_summary[table_name] = len(data)
+
+        return database_export, export_summary
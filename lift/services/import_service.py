@@ -4,6 +4,8 @@ import csv
 import json
 from pathlib import Path
 
+import duckdb
+
 from lift.core.database import DatabaseManager
 
 
@@ -18,6 +20,8 @@ class ImportService:
             db: Database manager instance
         """
         self.db = db
+        # Column name -> (data_type, is_nullable, column_default) per table, read once
+        self._columns_cache: dict[str, dict[str, tuple[str, str, str | None]]] = {}
 
     def import_from_csv(self, table_name: str, file_path: str) -> int:
         """
@@ -41,70 +45,80 @@ class ImportService:
 
         with self.db.get_connection() as conn:
             # Verify table exists
-            tables = conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' AND table_name = ?",
-                (table_name,),
-            ).fetchall()
+            column_names = self._table_columns(conn, table_name)
 
-            if not tables:
+            if not column_names:
                 raise ValueError(f"Table '{table_name}' does not exist")
 
-            # Get column information
-            columns_info = conn.execute(
-                "SELECT column_name, data_type FROM information_schema.columns "
-                f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"  # nosec B608  # table_name validated
-            ).fetchall()
-
-            column_names = [col[0] for col in columns_info]
-
-            # Read CSV file
-            with open(file_path_obj, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                csv_headers = reader.fieldnames
-
-                if not csv_headers:
-                    raise ValueError("CSV file has no headers")
-
-                # Validate headers match table columns (subset is OK)
-                for header in csv_headers:
-                    if header not in column_names:
-                        raise ValueError(
-                            f"CSV header '{header}' does not match any column in table '{table_name}'"
-                        )
-
-                # Prepare data for import
-                rows_data = []
-                for row in reader:
-                    # Convert empty strings to None
-                    processed_row: dict[str, str | None] = {}
-                    for key, value in row.items():
-                        if value == "" or value is None:
-                            processed_row[key] = None
-                        else:
-                            processed_row[key] = value
-                    rows_data.append(processed_row)
-
-                if not rows_data:
-                    return 0
-
-                # Validate data
-                if not self.validate_import_data(rows_data, table_name):
-                    raise ValueError("Data validation failed")
-
-                # Build INSERT query
-                insert_columns = list(csv_headers)
-                placeholders = ", ".join(["?" for _ in insert_columns])
-                columns_str = ", ".join(insert_columns)
-
-                insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"  # nosec B608  # table_name validated, columns from schema
-
-                # Insert data
-                for row_dict in rows_data:
-                    values = tuple(row_dict.get(col) for col in insert_columns)
-                    conn.execute(insert_query, values)
-
-                return len(rows_data)
+            # Read only the header; DuckDB parses the rows
+            with open(file_path_obj, encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                csv_headers = next(reader, None)
+
+            if not csv_headers:
+                raise ValueError("CSV file has no headers")
+
+            # Validate headers match table columns (subset is OK)
+            for header in csv_headers:
+                if header not in column_names:
+                    raise ValueError(
+                        f"CSV header '{header}' does not match any column in table '{table_name}'"
+                    )
+
+            # Validate data (required columns are checked against the header)
+            if not self.validate_import_data([dict.fromkeys(csv_headers)], table_name):
+                raise ValueError("Data validation failed")
+
+            # Parse like csv.DictReader: comma-delimited, double-quoted, every field read
+            # as text, short rows padded and extra fields dropped. Empty fields, quoted
+            # or not, become NULL through NULLIF.
+            column_types = ", ".join(f"'{header}': 'VARCHAR'" for header in csv_headers)
+            source = (
+                "read_csv(?, header = true, auto_detect = false, delim = ',', quote = '\"', "
+                "escape = '\"', null_padding = true, strict_mode = false, "
+                f"columns = {{{column_types}}})"
+            )
+            params = [str(file_path_obj)]
+            values = {header: f"NULLIF({header}, '')" for header in csv_headers}
+
+            # Validate every row in one scan: required columns set, values castable
+            checks = ["COUNT(*)"]
+            labels = []
+            for header in csv_headers:
+                data_type, is_nullable, _ = column_names[header]
+                if is_nullable == "NO" and header.lower() not in ["id", "created_at", "updated_at"]:
+                    checks.append(f"COUNT(*) - COUNT({values[header]})")
+                    labels.append(f"column '{header}' is empty")
+                if data_type != "VARCHAR":
+                    checks.append(
+                        f"COUNT(*) FILTER (WHERE {values[header]} IS NOT NULL "
+                        f"AND TRY_CAST({values[header]} AS {data_type}) IS NULL)"
+                    )
+                    labels.append(f"column '{header}' is not a valid {data_type}")
+
+            try:
+                counts = conn.execute(
+                    f"SELECT {', '.join(checks)} FROM {source}",  # nosec B608  # columns and types from schema
+                    params,
+                ).fetchone()
+            except duckdb.InvalidInputException as e:
+                raise ValueError(f"Invalid CSV file: {file_path}") from e
+            row_count, *failures = counts if counts else (0,)
+
+            for label, failed in zip(labels, failures, strict=True):
+                if failed:
+                    raise ValueError(f"Data validation failed: {label} in {failed} row(s)")
+
+            if not row_count:
+                return 0
+
+            insert_query = (
+                f"INSERT INTO {table_name} ({', '.join(csv_headers)}) "  # nosec B608  # table_name validated, columns from schema
+                f"SELECT {', '.join(values.values())} FROM {source}"
+            )
+
+            conn.execute(insert_query, params)
+            return int(row_count)
 
     def import_from_json(self, file_path: str) -> dict[str, int]:
         """
@@ -184,10 +198,11 @@ class ImportService:
 
             insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"  # nosec B608  # table_name validated, columns from schema
 
-            # Insert each row
-            for row_dict in data:
-                values = tuple(row_dict.get(col) for col in insert_columns)
-                conn.execute(insert_query, values)
+            # Insert every row with one prepared statement
+            conn.executemany(
+                insert_query,
+                [tuple(row_dict.get(col) for col in insert_columns) for row_dict in data],
+            )
 
         return len(data)
 
@@ -208,23 +223,14 @@ class ImportService:
         try:
             with self.db.get_connection() as conn:
                 # Verify table exists
-                tables = conn.execute(
-                    "SELECT table_name FROM information_schema.tables "
-                    "WHERE table_schema = 'main' AND table_name = ?",
-                    (table_name,),
-                ).fetchall()
+                table_columns = self._table_columns(conn, table_name)
 
-                if not tables:
+                if not table_columns:
                     return False
 
-                # Get column information
-                columns_info = conn.execute(
-                    "SELECT column_name, data_type, is_nullable FROM information_schema.columns "
-                    f"WHERE table_name = '{table_name}'"  # nosec B608  # table_name validated
-                ).fetchall()
-
                 valid_columns = {
-                    col[0]: {"type": col[1], "nullable": col[2]} for col in columns_info
+                    name: {"type": data_type, "nullable": is_nullable}
+                    for name, (data_type, is_nullable, _) in table_columns.items()
                 }
 
                 # Validate each row
@@ -268,43 +274,107 @@ class ImportService:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Exercise file not found: {file_path}")
 
-        with open(file_path_obj, encoding="utf-8") as f:
-            exercises = json.load(f)
+        # DuckDB's JSON reader scans the file; format='array' rejects anything but a list
+        source = "read_json(?, format='array')"
+        params = [str(file_path_obj)]
+
+        with self.db.get_connection() as conn:
+            try:
+                columns_info = conn.execute(f"DESCRIBE SELECT * FROM {source}", params).fetchall()
+            except duckdb.InvalidInputException as e:
+                raise ValueError("Exercise JSON must be a list of exercise objects") from e
 
-        if not isinstance(exercises, list):
-            raise ValueError("Exercise JSON must be a list of exercise objects")
+            count_result = conn.execute(f"SELECT COUNT(*) FROM {source}", params).fetchone()
+            exercise_count = int(count_result[0]) if count_result else 0
 
-        # Validate required fields
-        required_fields = ["name", "category", "primary_muscle", "equipment"]
-        for exercise in exercises:
+            if not exercise_count:
+                return 0
+
+            column_types = {col[0]: col[1] for col in columns_info}
+
+            # Validate required fields: present in the file and set on every exercise
+            required_fields = ["name", "category", "primary_muscle", "equipment"]
             for field in required_fields:
-                if field not in exercise:
+                if field not in column_types:
+                    raise ValueError(f"Exercise missing required field: {field}")
+
+            missing_counts = conn.execute(
+                "SELECT "
+                + ", ".join(f"COUNT(*) - COUNT({field})" for field in required_fields)
+                + f" FROM {source}",
+                params,
+            ).fetchone()
+            for field, missing in zip(required_fields, missing_counts or (), strict=True):
+                if missing:
                     raise ValueError(f"Exercise missing required field: {field}")
 
-        # Validate data
-        if not self.validate_import_data(exercises, "exercises"):
-            raise ValueError("Exercise data validation failed")
+            table_columns = self._table_columns(conn, "exercises")
+            for col in column_types:
+                if col not in table_columns:
+                    raise ValueError(
+                        f"Exercise field '{col}' does not match any column in table 'exercises'"
+                    )
+
+            # Validate data
+            if not self.validate_import_data([dict.fromkeys(column_types)], "exercises"):
+                raise ValueError("Exercise data validation failed")
+
+            # read_json unions the keys of every object, so a key missing from some
+            # objects reads as NULL there; fall back to the column default as a
+            # per-object INSERT would
+            columns = list(column_types)
+            select_exprs = []
+            for col in columns:
+                expr = col
+                if col == "secondary_muscles" and column_types[col].endswith("[]"):
+                    # Handle secondary_muscles as JSON array
+                    expr = f"to_json({col})"
+
+                column_default = table_columns[col][2]
+                if column_default is not None:
+                    expr = f"COALESCE({expr}, {column_default})"
+                select_exprs.append(expr)
+
+            insert_query = (
+                f"INSERT OR IGNORE INTO exercises ({', '.join(columns)}) "  # nosec B608  # columns checked against the table
+                f"SELECT {', '.join(select_exprs)} FROM {source}"
+            )
 
-        with self.db.get_connection() as conn:
-            imported = 0
-            for exercise in exercises:
-                # Handle secondary_muscles as JSON array
-                if "secondary_muscles" in exercise and isinstance(
-                    exercise["secondary_muscles"], list
-                ):
-                    exercise["secondary_muscles"] = json.dumps(exercise["secondary_muscles"])
-
-                # Build INSERT query
-                columns = list(exercise.keys())
-                placeholders = ", ".join(["?" for _ in columns])
-                columns_str = ", ".join(columns)
-
-                insert_query = (
-                    f"INSERT OR IGNORE INTO exercises ({columns_str}) VALUES ({placeholders})"
-                )
-
-                values = tuple(exercise.get(col) for col in columns)
-                conn.execute(insert_query, values)
-                imported += 1
-
-        return imported
+            try:
+                conn.execute(insert_query, params)
+            except duckdb.Error as e:
+                # e.g. a value of the wrong type for its column
+                raise ValueError(f"Invalid exercise data in {file_path_obj.name}: {e}") from e
+
+        return exercise_count
+
+    def _table_columns(
+        self, conn: duckdb.DuckDBPyConnection, table_name: str
+    ) -> dict[str, tuple[str, str, str | None]]:
+        """
+        Get a table's columns, caching them for the lifetime of this service.
+
+        Args:
+            conn: Open database connection
+            table_name: Name of the table
+
+        Returns:
+            Column name -> (data_type, is_nullable, column_default) in column order,
+            empty if the table doesn't exist
+        """
+        if table_name in self._columns_cache:
+            return self._columns_cache[table_name]
+
+        columns_info = conn.execute(
+            "SELECT column_name, data_type, is_nullable, column_default "
+            "FROM information_schema.columns "
+            "WHERE table_schema = 'main' AND table_name = ? ORDER BY ordinal_position",
+            (table_name,),
+        ).fetchall()
+
+        columns = {col[0]: (col[1], col[2], col[3]) for col in columns_info}
+
+        # Don't cache misses, so a table created later is still found
+        if columns:
+            self._columns_cache[table_name] = columns
+        return columns
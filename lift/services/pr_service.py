@@ -52,8 +52,24 @@ class PRService:
             ORDER BY s.exercise_id, s.weight DESC, s.reps DESC
         """
 
+        # Current best value for every record type of the exercises in this workout,
+        # fetched once rather than with a get_pr_by_type() query per candidate
+        best_query = """
+            SELECT pr.exercise_id, pr.record_type, MAX(pr.value)
+            FROM personal_records pr
+            WHERE pr.exercise_id IN (SELECT exercise_id FROM sets WHERE workout_id = ?)
+            GROUP BY pr.exercise_id, pr.record_type
+        """
+
         with self.db.get_connection() as conn:
             sets = conn.execute(query, (workout_id,)).fetchall()
+            best_rows = conn.execute(best_query, (workout_id,)).fetchall()
+
+        current_best = {(row[0], RecordType(row[1])): Decimal(str(row[2])) for row in best_rows}
+
+        def is_new(exercise_id: int, record_type: RecordType, value: Decimal) -> bool:
+            best = current_best.get((exercise_id, record_type))
+            return best is None or value > best
 
         new_prs = []
 
@@ -93,7 +109,7 @@ class PRService:
                         record_type = RecordType.TEN_RM
 
                     # Check if it's a new PR
-                    if self.is_new_pr(exercise_id, record_type, estimated_1rm):
+                    if is_new(exercise_id, record_type, estimated_1rm):
                         pr = self._create_pr_record(
                             exercise_id=exercise_id,
                             record_type=record_type,
@@ -112,7 +128,7 @@ class PRService:
                 best_volume_set = max(volume_sets, key=lambda x: x[0])[1]
                 volume = Decimal(str(best_volume_set[2])) * Decimal(best_volume_set[3])
 
-                if self.is_new_pr(exercise_id, RecordType.VOLUME, volume):
+                if is_new(exercise_id, RecordType.VOLUME, volume):
                     pr = self._create_pr_record(
                         exercise_id=exercise_id,
                         record_type=RecordType.VOLUME,
@@ -129,7 +145,7 @@ class PRService:
             max_weight_set = max(ex_sets, key=lambda x: x[2])
             max_weight = Decimal(str(max_weight_set[2]))
 
-            if self.is_new_pr(exercise_id, RecordType.MAX_WEIGHT, max_weight):
+            if is_new(exercise_id, RecordType.MAX_WEIGHT, max_weight):
                 pr = self._create_pr_record(
                     exercise_id=exercise_id,
                     record_type=RecordType.MAX_WEIGHT,
@@ -7,6 +7,36 @@ from lift.core.database import DatabaseManager, get_db
 from lift.core.models import Set, SetCreate
 
 
+_INSERT_SET = """
+    INSERT INTO sets (
+        workout_id, exercise_id, set_number, weight, weight_unit,
+        reps, rpe, tempo, set_type, rest_seconds,
+        is_superset, superset_group, notes, completed_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _set_params(set_data: SetCreate) -> tuple:
+    """Build the _INSERT_SET parameters for one set, completed now."""
+    return (
+        set_data.workout_id,
+        set_data.exercise_id,
+        set_data.set_number,
+        set_data.weight,
+        set_data.weight_unit.value if set_data.weight_unit else "lbs",
+        set_data.reps,
+        set_data.rpe,
+        set_data.tempo,
+        set_data.set_type.value if set_data.set_type else "working",
+        set_data.rest_seconds,
+        set_data.is_superset,
+        set_data.superset_group,
+        set_data.notes,
+        datetime.now(),
+    )
+
+
 class SetService:
     """Service for managing workout sets."""
 
@@ -39,42 +69,36 @@ class SetService:
             ...     reps=10
             ... ))
         """
-        query = """
-            INSERT INTO sets (
-                workout_id, exercise_id, set_number, weight, weight_unit,
-                reps, rpe, tempo, set_type, rest_seconds,
-                is_superset, superset_group, notes, completed_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            RETURNING *
-        """
+        query = f"{_INSERT_SET} RETURNING *"
 
         with self.db.get_connection() as conn:
-            result = conn.execute(
-                query,
-                (
-                    set_data.workout_id,
-                    set_data.exercise_id,
-                    set_data.set_number,
-                    set_data.weight,
-                    set_data.weight_unit.value if set_data.weight_unit else "lbs",
-                    set_data.reps,
-                    set_data.rpe,
-                    set_data.tempo,
-                    set_data.set_type.value if set_data.set_type else "working",
-                    set_data.rest_seconds,
-                    set_data.is_superset,
-                    set_data.superset_group,
-                    set_data.notes,
-                    datetime.now(),
-                ),
-            ).fetchone()
+            result = conn.execute(query, _set_params(set_data)).fetchone()
 
             if not result:
                 raise RuntimeError("Failed to create set")
 
             return self._row_to_set(result)
 
+    def add_sets(self, sets: list[SetCreate]) -> int:
+        """
+        Add several sets in one batched insert.
+
+        Unlike add_set, the created rows are not read back.
+
+        Args:
+            sets: Set creation data, in the order the sets were performed
+
+        Returns:
+            Number of sets added
+        """
+        if not sets:
+            return 0
+
+        with self.db.get_connection() as conn:
+            conn.executemany(_INSERT_SET, [_set_params(set_data) for set_data in sets])
+
+        return len(sets)
+
     def get_sets_for_workout(self, workout_id: int) -> list[Set]:
         """
         Get all sets for a workout.
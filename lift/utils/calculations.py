@@ -1,6 +1,7 @@
 """Calculations for strength training metrics and progressive overload."""
 
 from decimal import Decimal
+from functools import lru_cache
 
 
 # ============================================================================
@@ -8,6 +9,18 @@ from decimal import Decimal
 # ============================================================================
 
 
+@lru_cache(maxsize=128)
+def _epley_multiplier(reps: int) -> Decimal:
+    """Epley factor (1 + reps/30), cached since rep counts repeat constantly."""
+    return 1 + Decimal(reps) / Decimal(30)
+
+
+@lru_cache(maxsize=128)
+def _brzycki_multiplier(reps: int) -> Decimal:
+    """Brzycki factor 36 / (37 - reps), cached since rep counts repeat constantly."""
+    return Decimal(36) / (Decimal(37) - Decimal(reps))
+
+
 def calculate_1rm_epley(weight: Decimal, reps: int) -> Decimal:
     """
     Calculate estimated 1RM using Epley formula.
@@ -24,7 +37,7 @@ def calculate_1rm_epley(weight: Decimal, reps: int) -> Decimal:
     """
     if reps == 1:
         return weight
-    return weight * (1 + Decimal(reps) / Decimal(30))
+    return weight * _epley_multiplier(reps)
 
 
 def calculate_1rm_brzycki(weight: Decimal, reps: int) -> Decimal:
@@ -46,7 +59,7 @@ def calculate_1rm_brzycki(weight: Decimal, reps: int) -> Decimal:
     if reps >= 37:
         # Formula breaks down for very high reps
         return calculate_1rm_epley(weight, reps)
-    return weight * (Decimal(36) / (Decimal(37) - Decimal(reps)))
+    return weight * _brzycki_multiplier(reps)
 
 
 def calculate_1rm_lander(weight: Decimal, reps: int) -> Decimal:
@@ -189,7 +202,7 @@ def calculate_n_rm(one_rm: Decimal, target_reps: int) -> Decimal:
     """
     if target_reps == 1:
         return one_rm
-    return one_rm / (1 + Decimal(target_reps) / Decimal(30))
+    return one_rm / _epley_multiplier(target_reps)
 
 
 def calculate_percentage_of_1rm(one_rm: Decimal, percentage: Decimal) -> Decimal:
@@ -238,7 +251,8 @@ def calculate_tonnage(sets_data: list[tuple[Decimal, int]]) -> Decimal:
     Returns:
         Total tonnage
     """
-    return sum((weight * Decimal(reps) for weight, reps in sets_data), start=Decimal(0))
+    # Decimal * int is exact and avoids building a Decimal per set
+    return sum((weight * reps for weight, reps in sets_data), start=Decimal(0))
 
 
 # ============================================================================
@@ -466,6 +480,18 @@ def estimate_reps_at_weight(one_rm: Decimal, weight: Decimal) -> int:
     return max(1, int(reps))
 
 
+# RIR indexed by RPE in half-point steps (index = int(rpe × 2), clamped to 0-20)
+_RIR_BY_HALF_RPE = (4,) * 14 + (3, 3, 2, 2, 1, 1, 0)
+
+_RPE_BY_RIR = {
+    0: Decimal("10"),
+    1: Decimal("9"),
+    2: Decimal("8"),
+    3: Decimal("7"),
+    4: Decimal("6.5"),
+}
+
+
 def rpe_to_rir(rpe: Decimal) -> int:
     """
     Convert RPE (Rate of Perceived Exertion) to RIR (Reps in Reserve).
@@ -477,15 +503,8 @@ def rpe_to_rir(rpe: Decimal) -> int:
         Estimated reps in reserve
     """
     # RPE 10 = 0 RIR, RPE 9.5 = 0-1 RIR, RPE 9 = 1 RIR, etc.
-    if rpe >= Decimal("10"):
-        return 0
-    if rpe >= Decimal("9.5") or rpe >= Decimal("9"):
-        return 1
-    if rpe >= Decimal("8.5") or rpe >= Decimal("8"):
-        return 2
-    if rpe >= Decimal("7.5") or rpe >= Decimal("7"):
-        return 3
-    return 4
+    index = int(rpe * 2)
+    return _RIR_BY_HALF_RPE[max(0, min(index, len(_RIR_BY_HALF_RPE) - 1))]
 
 
 def rir_to_rpe(rir: int) -> Decimal:
@@ -498,11 +517,4 @@ def rir_to_rpe(rir: int) -> Decimal:
     Returns:
         RPE value
     """
-    rir_to_rpe_map = {
-        0: Decimal("10"),
-        1: Decimal("9"),
-        2: Decimal("8"),
-        3: Decimal("7"),
-        4: Decimal("6.5"),
-    }
-    return rir_to_rpe_map.get(rir, Decimal("6"))
+    return _RPE_BY_RIR.get(rir, Decimal("6"))
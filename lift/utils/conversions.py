@@ -1,5 +1,6 @@
 """Unit conversion utilities for body measurements and weights."""
 
+from collections.abc import Callable
 from decimal import ROUND_HALF_UP, Decimal
 
 from lift.core.models import MeasurementUnit, WeightUnit
@@ -11,6 +12,9 @@ KG_TO_LBS_FACTOR = Decimal("2.20462262")
 INCHES_TO_CM_FACTOR = Decimal("2.54")
 CM_TO_INCHES_FACTOR = Decimal("0.393700787")
 
+# Every conversion rounds to 2 decimal places
+_TWO_PLACES = Decimal("0.01")
+
 
 def lbs_to_kg(lbs: Decimal) -> Decimal:
     """
@@ -27,7 +31,7 @@ def lbs_to_kg(lbs: Decimal) -> Decimal:
         Decimal('84.00')
     """
     result = lbs * LBS_TO_KG_FACTOR
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
 
 def kg_to_lbs(kg: Decimal) -> Decimal:
@@ -45,7 +49,7 @@ def kg_to_lbs(kg: Decimal) -> Decimal:
         Decimal('185.19')
     """
     result = kg * KG_TO_LBS_FACTOR
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
 
 def inches_to_cm(inches: Decimal) -> Decimal:
@@ -63,7 +67,7 @@ def inches_to_cm(inches: Decimal) -> Decimal:
         Decimal('39.37')
     """
     result = inches * INCHES_TO_CM_FACTOR
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
 
 def cm_to_inches(cm: Decimal) -> Decimal:
@@ -81,7 +85,20 @@ def cm_to_inches(cm: Decimal) -> Decimal:
         Decimal('15.50')
     """
     result = cm * CM_TO_INCHES_FACTOR
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+
+
+# Conversion functions keyed by (from_unit, to_unit)
+_WEIGHT_CONVERSIONS: dict[tuple[WeightUnit, WeightUnit], Callable[[Decimal], Decimal]] = {
+    (WeightUnit.LBS, WeightUnit.KG): lbs_to_kg,
+    (WeightUnit.KG, WeightUnit.LBS): kg_to_lbs,
+}
+_MEASUREMENT_CONVERSIONS: dict[
+    tuple[MeasurementUnit, MeasurementUnit], Callable[[Decimal], Decimal]
+] = {
+    (MeasurementUnit.INCHES, MeasurementUnit.CENTIMETERS): inches_to_cm,
+    (MeasurementUnit.CENTIMETERS, MeasurementUnit.INCHES): cm_to_inches,
+}
 
 
 def convert_weight(value: Decimal, from_unit: WeightUnit, to_unit: WeightUnit) -> Decimal:
@@ -101,13 +118,13 @@ def convert_weight(value: Decimal, from_unit: WeightUnit, to_unit: WeightUnit) -
         Decimal('84.00')
     """
     if from_unit == to_unit:
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return value.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
-    if from_unit == WeightUnit.LBS and to_unit == WeightUnit.KG:
-        return lbs_to_kg(value)
-    if from_unit == WeightUnit.KG and to_unit == WeightUnit.LBS:
-        return kg_to_lbs(value)
-    raise ValueError(f"Unknown weight unit conversion: {from_unit} to {to_unit}")
+    try:
+        convert = _WEIGHT_CONVERSIONS[(from_unit, to_unit)]
+    except KeyError:
+        raise ValueError(f"Unknown weight unit conversion: {from_unit} to {to_unit}") from None
+    return convert(value)
 
 
 def convert_measurement(
@@ -129,10 +146,10 @@ def convert_measurement(
         Decimal('39.37')
     """
     if from_unit == to_unit:
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return value.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
-    if from_unit == MeasurementUnit.INCHES and to_unit == MeasurementUnit.CENTIMETERS:
-        return inches_to_cm(value)
-    if from_unit == MeasurementUnit.CENTIMETERS and to_unit == MeasurementUnit.INCHES:
-        return cm_to_inches(value)
-    raise ValueError(f"Unknown measurement unit conversion: {from_unit} to {to_unit}")
+    try:
+        convert = _MEASUREMENT_CONVERSIONS[(from_unit, to_unit)]
+    except KeyError:
+        raise ValueError(f"Unknown measurement unit conversion: {from_unit} to {to_unit}") from None
+    return convert(value)
@@ -4,13 +4,25 @@ Shared pytest fixtures for all tests.
 This module provides reusable fixtures that can be used across all test files.
 """
 
-from collections.abc import Generator
+import os
+import shutil
+import sys
+from collections.abc import Callable, Generator
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 
 import pytest
-
-from lift.core.database import DatabaseManager, reset_db_instance
+import typer
+from click.testing import CliRunner, Result
+
+from lift.core.database import (
+    ConnectionConfig,
+    DatabaseManager,
+    close_cached_connections,
+    enable_connection_reuse,
+    reset_db_instance,
+)
 from lift.core.models import (
     CategoryType,
     EquipmentType,
@@ -25,12 +37,78 @@ from lift.core.models import (
     SplitType,
     WorkoutCreate,
 )
+from lift.main import app
+from lift.services.body_service import BodyService
 from lift.services.exercise_service import ExerciseService
 from lift.services.program_service import ProgramService
 from lift.services.set_service import SetService
 from lift.services.workout_service import WorkoutService
 
 
+# Click command tree for the Typer app, built once instead of on every invoke
+_click_app = typer.main.get_command(app)
+
+_cli_runner = CliRunner()
+
+# Plain-text output so Rich skips colour detection and ANSI rendering
+_CLI_ENV = {"NO_COLOR": "1", "TERM": "dumb"}
+
+# tmpfs-backed basetemp created for this run, removed again if the run passes
+_shm_basetemp: Path | None = None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Put pytest's temp directories on /dev/shm when running on Linux.
+
+    Every test database lives under ``tmp_path``, so this keeps DuckDB file
+    creation and fsyncs in RAM. An explicit ``--basetemp`` wins, and xdist
+    workers inherit a subdirectory of the controller's basetemp.
+    """
+    global _shm_basetemp
+
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return
+
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK):
+        _shm_basetemp = shm / f"lift-tests-{os.getpid()}"
+        config.option.basetemp = str(_shm_basetemp)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Remove the tmpfs basetemp after a passing run so runs don't accumulate in RAM.
+
+    After a failing run it is left in place, so ``tmp_path_retention_policy``
+    still keeps the failed tests' directories for inspection.
+    """
+    if _shm_basetemp is not None and exitstatus == 0:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+
+
+# Connection settings for throwaway test databases. A single thread keeps parallel
+# test workers from oversubscribing the CPU, and nothing the schema uses needs an
+# extension fetched or loaded on demand.
+_TEST_CONNECTION_CONFIG: ConnectionConfig = {
+    "threads": 1,
+    "preserve_insertion_order": False,
+    "autoinstall_known_extensions": False,
+    "autoload_known_extensions": False,
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_test_connections() -> Generator[None, None, None]:
+    """Share one lightweight connection per test database across all managers."""
+    enable_connection_reuse(config=_TEST_CONNECTION_CONFIG)
+    yield
+    enable_connection_reuse(False)
+    close_cached_connections()
+
+
 @pytest.fixture(autouse=True)
 def reset_global_db() -> Generator[None, None, None]:
     """Reset the global database instance before each test."""
@@ -39,53 +117,172 @@ def reset_global_db() -> Generator[None, None, None]:
     reset_db_instance()
 
 
+def _run_cli(args: list[str], input: str | None = None) -> Result:
+    """Invoke the cached LIFT Click command in-process."""
+    return _cli_runner.invoke(_click_app, args, input=input, env=_CLI_ENV, catch_exceptions=False)
+
+
+def _bind_cli(db_path: str) -> Callable[..., Result]:
+    """Build a ``run`` variant that prefixes every call with ``--db-path db_path``."""
+
+    def _cli(*args: str, input: str | None = None) -> Result:
+        return _run_cli(["--db-path", db_path, *args], input=input)
+
+    return _cli
+
+
+@pytest.fixture
+def run() -> Callable[..., Result]:
+    """
+    Run a LIFT CLI command, e.g. ``run(["--db-path", path, "stats", "summary"])``.
+
+    Reuses one runner and the prebuilt Click command tree across all calls.
+    """
+    return _run_cli
+
+
+@pytest.fixture(scope="session")
+def _template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run ``initialize_database()`` once per session and return the resulting file."""
+    template_path = tmp_path_factory.mktemp("template") / "template.duckdb"
+    DatabaseManager(str(template_path)).initialize_database()
+    # Checkpoint and close before tests copy the file
+    close_cached_connections()
+    return template_path
+
+
+@pytest.fixture
+def db(_template_db: Path, tmp_path: Path) -> DatabaseManager:
+    """
+    Create a temporary database for testing (function scope - gets reset each test).
+
+    The file lives under pytest's ``tmp_path``, which is unique per test and per
+    xdist worker, so tests can run in parallel without sharing database files.
+    It starts as a copy of ``_template_db`` rather than re-running the schema.
+    """
+    db_path = tmp_path / "test.duckdb"
+    shutil.copyfile(_template_db, db_path)
+    return DatabaseManager(str(db_path))
+
+
 @pytest.fixture
-def db() -> Generator[DatabaseManager, None, None]:
-    """Create a temporary database for testing (function scope - gets reset each test)."""
-    import tempfile
-    from pathlib import Path
-
-    # Create a temporary file path (delete the empty file so DuckDB can create it fresh)
-    temp_file = tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False)
-    temp_path = temp_file.name
-    temp_file.close()
-    Path(temp_path).unlink()  # Delete empty file so DuckDB can create it
-
-    try:
-        db = DatabaseManager(temp_path)
-        db.initialize_database()
-        yield db
-    finally:
-        # Clean up
-        Path(temp_path).unlink(missing_ok=True)
-        if Path(temp_path + ".wal").exists():
-            Path(temp_path + ".wal").unlink()
+def db_rollback(db: DatabaseManager) -> Generator[DatabaseManager, None, None]:
+    """
+    ``db`` inside a transaction that is rolled back when the test ends.
+
+    With connection reuse enabled every ``get_connection()`` call hands out the same
+    cached connection, so all service calls in the test run inside this transaction.
+    Pair it with a broader-scoped ``db`` to share one database without sharing state.
+    """
+    with db.get_connection() as conn:
+        # Connection methods instead of SQL strings, so there is nothing to parse per test
+        conn.begin()
+        try:
+            yield db
+        finally:
+            conn.rollback()
 
 
 @pytest.fixture(scope="session")
-def session_db() -> Generator[DatabaseManager, None, None]:
+def session_db(tmp_path_factory: pytest.TempPathFactory) -> DatabaseManager:
     """
     Create a session-scoped database for read-only tests.
 
     Use this for tests that only read data and don't modify the database.
-    Much faster than creating a new DB for each test.
+    Much faster than creating a new DB for each test. Under xdist each worker
+    builds its own copy in its own base temp directory.
+    """
+    db = DatabaseManager(str(tmp_path_factory.mktemp("session_db") / "session.duckdb"))
+    db.initialize_database()
+    return db
+
+
+@pytest.fixture(scope="session")
+def _seed_db(_template_db: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build the database ``lift init`` creates once per session and return its file.
+
+    CLI tests copy this template instead of re-creating the schema and the
+    137 seed exercises for every test. The ``init`` command itself is covered
+    by ``TestCLIInitialization``.
+    """
+    seed_path = tmp_path_factory.mktemp("seed") / "seed.duckdb"
+    shutil.copyfile(_template_db, seed_path)
+    ExerciseService(DatabaseManager(str(seed_path))).load_seed_exercises()
+    close_cached_connections()
+    return seed_path
+
+
+@pytest.fixture(scope="session")
+def _seed_db_with_samples(_seed_db: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session template from ``_seed_db`` with the sample programs loaded."""
+    seed_path = tmp_path_factory.mktemp("seed_samples") / "seed.duckdb"
+    shutil.copyfile(_seed_db, seed_path)
+    ProgramService(DatabaseManager(str(seed_path))).load_seed_programs()
+    close_cached_connections()
+    return seed_path
+
+
+@pytest.fixture(scope="session")
+def _seed_db_with_weight(_seed_db: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session template from ``_seed_db`` with a single 180 lbs bodyweight entry."""
+    seed_path = tmp_path_factory.mktemp("seed_weight") / "seed.duckdb"
+    shutil.copyfile(_seed_db, seed_path)
+    BodyService(DatabaseManager(str(seed_path))).log_weight(Decimal("180"))
+    close_cached_connections()
+    return seed_path
+
+
+@pytest.fixture
+def temp_db(tmp_path: Path) -> str:
+    """Create a temporary database path."""
+    return str(tmp_path / "test.duckdb")
+
+
+@pytest.fixture
+def initialized_db(_seed_db: Path, temp_db: str) -> str:
+    """Create an initialized temporary database by copying the session template."""
+    shutil.copyfile(_seed_db, temp_db)
+    return temp_db
+
+
+@pytest.fixture
+def initialized_db_with_samples(_seed_db_with_samples: Path, temp_db: str) -> str:
+    """Create an initialized temporary database with the sample programs loaded."""
+    shutil.copyfile(_seed_db_with_samples, temp_db)
+    return temp_db
+
+
+@pytest.fixture
+def db_with_weight_180(_seed_db_with_weight: Path, temp_db: str) -> str:
+    """Create an initialized temporary database with 180 lbs logged as bodyweight."""
+    shutil.copyfile(_seed_db_with_weight, temp_db)
+    return temp_db
+
+
+@pytest.fixture(scope="class")
+def initialized_db_ro(_seed_db: Path, tmp_path_factory: pytest.TempPathFactory) -> str:
     """
-    import tempfile
-    from pathlib import Path
-
-    temp_file = tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False)
-    temp_path = temp_file.name
-    temp_file.close()
-    Path(temp_path).unlink()
-
-    try:
-        db = DatabaseManager(temp_path)
-        db.initialize_database()
-        yield db
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
-        if Path(temp_path + ".wal").exists():
-            Path(temp_path + ".wal").unlink()
+    Copy of ``_seed_db`` shared by every test in a class.
+
+    Only for tests that never write: the copy is made once per class, so a
+    write would leak into the later tests of that class.
+    """
+    db_path = tmp_path_factory.mktemp("ro") / "test.duckdb"
+    shutil.copyfile(_seed_db, db_path)
+    return str(db_path)
+
+
+@pytest.fixture
+def cli(initialized_db: str) -> Callable[..., Result]:
+    """Run a LIFT CLI command against ``initialized_db``, e.g. ``cli("stats", "summary")``."""
+    return _bind_cli(initialized_db)
+
+
+@pytest.fixture
+def cli_ro(initialized_db_ro: str) -> Callable[..., Result]:
+    """Like ``cli``, against the class-scoped read-only ``initialized_db_ro``."""
+    return _bind_cli(initialized_db_ro)
 
 
 @pytest.fixture
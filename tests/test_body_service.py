@@ -1,21 +1,73 @@
 """Tests for body measurement service."""
 
+import shutil
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 
 import pytest
 
-from lift.core.database import DatabaseManager
+from lift.core.database import DatabaseManager, close_cached_connections
 from lift.core.models import BodyMeasurementCreate, MeasurementUnit, WeightUnit
 from lift.services.body_service import BodyService
 
 
+# Pre-built weights for the logging loops below
+_WEIGHTS_185 = tuple(Decimal(f"185.{i}") for i in range(5))
+_WEIGHTS_180 = tuple(Decimal(f"180.{i}") for i in range(10))
+
+
 @pytest.fixture
 def service(db: DatabaseManager) -> BodyService:
     """Create a BodyService instance with test database."""
     return BodyService(db)
 
 
+@pytest.fixture(scope="session")
+def _weekly_seed_template(_template_db: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build a database with weekly measurements once per session.
+
+    Holds 8 weekly weigh-ins (180.0-180.7 lbs) and 4 weekly chest
+    measurements (42.0-42.3 in), all within the last 8 weeks.
+    """
+    template_path = tmp_path_factory.mktemp("weekly_seed") / "seed.duckdb"
+    shutil.copyfile(_template_db, template_path)
+    seed_service = BodyService(DatabaseManager(str(template_path)))
+
+    weight_start = datetime.now() - timedelta(weeks=8)
+    for week, weight in enumerate(_WEIGHTS_180[:8]):
+        seed_service.log_measurement(
+            BodyMeasurementCreate(
+                date=weight_start + timedelta(weeks=week),
+                weight=weight,
+                weight_unit=WeightUnit.LBS,
+            )
+        )
+
+    chest_start = datetime.now() - timedelta(weeks=4)
+    for week in range(4):
+        seed_service.log_measurement(
+            BodyMeasurementCreate(
+                date=chest_start + timedelta(weeks=week),
+                chest=Decimal(f"42.{week}"),
+                measurement_unit=MeasurementUnit.INCHES,
+            )
+        )
+
+    # Checkpoint and close before tests copy the file
+    close_cached_connections()
+    return template_path
+
+
+@pytest.fixture
+def weekly_seeded_db(_weekly_seed_template: Path, tmp_path: Path) -> DatabaseManager:
+    """Per-test copy of the weekly measurement template."""
+    db_path = tmp_path / "test.duckdb"
+    shutil.copyfile(_weekly_seed_template, db_path)
+    return DatabaseManager(str(db_path))
+
+
 class TestLogWeight:
     """Test weight logging functionality."""
 
@@ -115,8 +167,8 @@ class TestGetLatestMeasurement:
     def test_get_latest_measurement_when_exists(self, service: BodyService) -> None:
         """Test getting latest measurement when measurements exist."""
         # Log several measurements
-        for i in range(3):
-            service.log_weight(Decimal(f"185.{i}"), WeightUnit.LBS)
+        for weight in _WEIGHTS_185[:3]:
+            service.log_weight(weight, WeightUnit.LBS)
 
         latest = service.get_latest_measurement()
         assert latest is not None
@@ -147,8 +199,8 @@ class TestMeasurementHistory:
     def test_get_measurement_history(self, service: BodyService) -> None:
         """Test retrieving measurement history."""
         # Create multiple measurements
-        for i in range(5):
-            service.log_weight(Decimal(f"185.{i}"), WeightUnit.LBS)
+        for weight in _WEIGHTS_185:
+            service.log_weight(weight, WeightUnit.LBS)
 
         history = service.get_measurement_history(limit=10)
         assert len(history) == 5
@@ -158,24 +210,15 @@ class TestMeasurementHistory:
     def test_get_measurement_history_with_limit(self, service: BodyService) -> None:
         """Test that limit parameter works correctly."""
         # Create 10 measurements
-        for i in range(10):
-            service.log_weight(Decimal(f"180.{i}"), WeightUnit.LBS)
+        for weight in _WEIGHTS_180:
+            service.log_weight(weight, WeightUnit.LBS)
 
         history = service.get_measurement_history(limit=5)
         assert len(history) == 5
 
-    def test_get_weight_history(self, service: BodyService) -> None:
+    def test_get_weight_history(self, weekly_seeded_db: DatabaseManager) -> None:
         """Test getting weight history over time."""
-        # Create measurements over several weeks
-        base_date = datetime.now() - timedelta(weeks=8)
-
-        for week in range(8):
-            measurement_data = BodyMeasurementCreate(
-                date=base_date + timedelta(weeks=week),
-                weight=Decimal(f"180.{week}"),
-                weight_unit=WeightUnit.LBS,
-            )
-            service.log_measurement(measurement_data)
+        service = BodyService(weekly_seeded_db)
 
         history = service.get_weight_history(weeks_back=12)
         assert len(history) == 8
@@ -186,18 +229,9 @@ class TestMeasurementHistory:
 class TestMeasurementTrend:
     """Test measurement trend analysis."""
 
-    def test_get_measurement_trend_valid_field(self, service: BodyService) -> None:
+    def test_get_measurement_trend_valid_field(self, weekly_seeded_db: DatabaseManager) -> None:
         """Test getting trend for a valid measurement field."""
-        # Create measurements with chest values
-        base_date = datetime.now() - timedelta(weeks=4)
-
-        for week in range(4):
-            measurement_data = BodyMeasurementCreate(
-                date=base_date + timedelta(weeks=week),
-                chest=Decimal(f"42.{week}"),
-                measurement_unit=MeasurementUnit.INCHES,
-            )
-            service.log_measurement(measurement_data)
+        service = BodyService(weekly_seeded_db)
 
         trend = service.get_measurement_trend("chest", weeks_back=12)
         assert len(trend) == 4
@@ -200,6 +200,13 @@ class TestRPEConversions:
         assert rpe_to_rir(Decimal("7")) == 3
         assert rpe_to_rir(Decimal("6")) == 4
 
+    def test_rpe_to_rir_between_and_outside_steps(self):
+        """Test RPE values off the half-point scale round down to the lower step."""
+        assert rpe_to_rir(Decimal("9.7")) == 1
+        assert rpe_to_rir(Decimal("6.9")) == 4
+        assert rpe_to_rir(Decimal("11")) == 0
+        assert rpe_to_rir(Decimal("0")) == 4
+
     def test_rir_to_rpe_zero(self):
         """Test converting 0 RIR to RPE."""
         assert rir_to_rpe(0) == Decimal("10")
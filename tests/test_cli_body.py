@@ -1,80 +1,77 @@
 """Tests for body tracking CLI commands."""
 
-from pathlib import Path
+from collections.abc import Callable
 
 import pytest
-from typer.testing import CliRunner
+import typer
+from click.testing import Result
 
-from lift.main import app
-
-
-runner = CliRunner()
-
-
-@pytest.fixture
-def temp_db(tmp_path: Path) -> str:
-    """Create a temporary database path."""
-    db_path = tmp_path / "test.duckdb"
-    return str(db_path)
+from lift.cli.body import body_app, history, latest, weight
 
 
 @pytest.fixture
-def initialized_db(temp_db: str) -> str:
-    """Create and initialize a temporary database."""
-    result = runner.invoke(app, ["--db-path", temp_db, "init"])
-    assert result.exit_code == 0
-    return temp_db
+def body_ctx(initialized_db: str) -> typer.Context:
+    """Context for calling body command callbacks directly, bypassing argv parsing."""
+    return typer.Context(typer.main.get_command(body_app), obj={"db_path": initialized_db})
 
 
 @pytest.mark.cli
 class TestBodyWeight:
     """Test body weight logging commands."""
 
-    def test_log_weight_lbs(self, initialized_db: str) -> None:
+    def test_log_weight_lbs(
+        self, body_ctx: typer.Context, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test logging weight in pounds."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "weight", "185.5"])
+        weight(body_ctx, value=185.5, unit="lbs")
 
-        assert result.exit_code == 0
-        assert "185.5" in result.stdout or "logged" in result.stdout.lower()
+        stdout = capsys.readouterr().out
+        assert "185.5" in stdout or "logged" in stdout.lower()
 
-    def test_log_weight_kg(self, initialized_db: str) -> None:
+    def test_log_weight_kg(
+        self, body_ctx: typer.Context, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test logging weight in kilograms."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "body", "weight", "84.0", "--unit", "kg"]
-        )
+        weight(body_ctx, value=84.0, unit="kg")
 
-        assert result.exit_code == 0
-        assert "84" in result.stdout or "logged" in result.stdout.lower()
+        stdout = capsys.readouterr().out
+        assert "84" in stdout or "logged" in stdout.lower()
 
-    def test_log_weight_invalid(self, initialized_db: str) -> None:
+    def test_log_weight_invalid(self, cli: Callable[..., Result]) -> None:
         """Test logging invalid weight value."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "weight", "invalid"])
+        result = cli("body", "weight", "invalid")
 
         assert result.exit_code != 0
 
-    def test_log_weight_shows_previous(self, initialized_db: str) -> None:
+    def test_log_weight_shows_previous(
+        self, body_ctx: typer.Context, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that logging weight shows previous weight."""
-        # Log first weight via CLI
-        result1 = runner.invoke(app, ["--db-path", initialized_db, "body", "weight", "180.0"])
-        assert result1.exit_code == 0
+        # Log first weight
+        weight(body_ctx, value=180.0, unit="lbs")
+        capsys.readouterr()
 
-        # Log second weight
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "weight", "182.5"])
+        # Log second weight (raises typer.Exit on failure)
+        weight(body_ctx, value=182.5, unit="lbs")
 
-        assert result.exit_code == 0
         # Should show comparison with previous weight
+        stdout = capsys.readouterr().out
+        assert "Previous: 180" in stdout
+        assert "+2.5 lbs" in stdout
 
 
 @pytest.mark.cli
 class TestBodyHistory:
     """Test body measurement history commands."""
 
-    def test_history_empty(self, initialized_db: str) -> None:
+    def test_history_empty(
+        self, body_ctx: typer.Context, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test viewing history with no measurements."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "history"])
+        history(body_ctx, measurement=None, weeks=12, limit=20)
 
-        assert result.exit_code == 0
         # Should handle empty case gracefully
+        assert "No measurements found" in capsys.readouterr().out
 
     @pytest.mark.skip(reason="Needs proper CLI-only test implementation")
     def test_history_with_data(self, initialized_db: str) -> None:
@@ -91,12 +88,14 @@ class TestBodyHistory:
 class TestBodyLatest:
     """Test latest body measurement commands."""
 
-    def test_latest_empty(self, initialized_db: str) -> None:
+    def test_latest_empty(
+        self, body_ctx: typer.Context, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test getting latest measurement when none exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "latest"])
+        latest(body_ctx)
 
-        assert result.exit_code == 0
-        assert "No measurements" in result.stdout or "no data" in result.stdout.lower()
+        stdout = capsys.readouterr().out
+        assert "No measurements" in stdout or "no data" in stdout.lower()
 
     @pytest.mark.skip(reason="Needs proper CLI-only test implementation")
     def test_latest_with_data(self, initialized_db: str) -> None:
@@ -109,9 +108,9 @@ class TestBodyProgress:
     """Test body progress tracking commands."""
 
     @pytest.mark.skip(reason="Body progress CLI command not yet fully implemented")
-    def test_progress_empty(self, initialized_db: str) -> None:
+    def test_progress_empty(self, cli: Callable[..., Result]) -> None:
         """Test viewing progress with no data."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "body", "progress"])
+        result = cli("body", "progress")
 
         assert result.exit_code == 0
         # Should handle empty case
@@ -126,11 +125,9 @@ class TestBodyProgress:
 class TestBodyCompare:
     """Test body measurement comparison commands."""
 
-    def test_compare_invalid_ids(self, initialized_db: str) -> None:
+    def test_compare_invalid_ids(self, cli: Callable[..., Result]) -> None:
         """Test comparing non-existent measurements."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "body", "compare", "99999", "99998"]
-        )
+        result = cli("body", "compare", "99999", "99998")
 
         # Should fail or handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
@@ -4,65 +4,49 @@ CLI integration tests.
 Tests CLI commands end-to-end using Typer's testing utilities.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from typer.testing import CliRunner
-
-from lift.main import app
-
-
-runner = CliRunner()
-
-
-@pytest.fixture
-def temp_db(tmp_path: Path) -> str:
-    """Create a temporary database path."""
-    db_path = tmp_path / "test.duckdb"
-    return str(db_path)
+from click.testing import Result
 
 
 class TestCLIInitialization:
     """Test CLI initialization commands."""
 
-    def test_init_command(self, temp_db: str) -> None:
+    def test_init_command(self, temp_db: str, run: Callable[..., Result]) -> None:
         """Test database initialization via CLI."""
-        result = runner.invoke(app, ["--db-path", temp_db, "init"])
+        result = run(["--db-path", temp_db, "init"])
 
         assert result.exit_code == 0
         assert "Database initialized successfully" in result.stdout
         assert Path(temp_db).exists()
 
-    def test_init_force_flag(self, temp_db: str) -> None:
+    @pytest.mark.integration
+    def test_init_force_flag(self, cli: Callable[..., Result]) -> None:
         """Test force reinitialization."""
-        # Initialize first time
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
         # Try to reinit without force (should fail)
-        result = runner.invoke(app, ["--db-path", temp_db, "init"])
+        result = cli("init")
         assert result.exit_code == 1
         assert "already exists" in result.stdout
 
         # Reinit with force (should succeed)
-        result = runner.invoke(app, ["--db-path", temp_db, "init", "--force"])
+        result = cli("init", "--force")
         assert result.exit_code == 0
 
-    def test_info_command(self, temp_db: str) -> None:
+    def test_info_command(self, cli_ro: Callable[..., Result]) -> None:
         """Test database info command."""
-        # Initialize database
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
         # Get info
-        result = runner.invoke(app, ["--db-path", temp_db, "info"])
+        result = cli_ro("info")
 
         assert result.exit_code == 0
         assert "Database Information" in result.stdout
         assert "exercises" in result.stdout
         assert "137 rows" in result.stdout  # Seed exercises
 
-    def test_version_command(self) -> None:
+    def test_version_command(self, run: Callable[..., Result]) -> None:
         """Test version command."""
-        result = runner.invoke(app, ["version"])
+        result = run(["version"])
 
         assert result.exit_code == 0
         assert "LIFT" in result.stdout
@@ -72,53 +56,39 @@ class TestCLIInitialization:
 class TestCLIExerciseCommands:
     """Test exercise-related CLI commands."""
 
-    def test_exercises_list(self, temp_db: str) -> None:
+    def test_exercises_list(self, cli_ro: Callable[..., Result]) -> None:
         """Test listing exercises."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "exercises", "list"])
+        result = cli_ro("exercises", "list")
 
         assert result.exit_code == 0
         assert "Barbell Bench Press" in result.stdout
 
-    def test_exercises_search(self, temp_db: str) -> None:
+    def test_exercises_search(self, cli_ro: Callable[..., Result]) -> None:
         """Test searching exercises."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "exercises", "search", "bench"])
+        result = cli_ro("exercises", "search", "bench")
 
         assert result.exit_code == 0
         assert "Bench Press" in result.stdout
 
-    def test_exercises_filter_by_category(self, temp_db: str) -> None:
+    def test_exercises_filter_by_category(self, cli_ro: Callable[..., Result]) -> None:
         """Test filtering exercises by category."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(
-            app, ["--db-path", temp_db, "exercises", "list", "--category", "Push"]
-        )
+        result = cli_ro("exercises", "list", "--category", "Push")
 
         assert result.exit_code == 0
         # Should show push exercises
         assert "Bench Press" in result.stdout or "Push" in result.stdout
 
-    def test_exercises_info(self, temp_db: str) -> None:
+    def test_exercises_info(self, cli_ro: Callable[..., Result]) -> None:
         """Test getting exercise info."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(
-            app, ["--db-path", temp_db, "exercises", "info", "Barbell Bench Press"]
-        )
+        result = cli_ro("exercises", "info", "Barbell Bench Press")
 
         assert result.exit_code == 0
         assert "Barbell Bench Press" in result.stdout
         assert "Chest" in result.stdout
 
-    def test_exercises_stats(self, temp_db: str) -> None:
+    def test_exercises_stats(self, cli_ro: Callable[..., Result]) -> None:
         """Test exercise library statistics."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "exercises", "stats"])
+        result = cli_ro("exercises", "stats")
 
         assert result.exit_code == 0
         assert "Exercise Library Statistics" in result.stdout
@@ -127,31 +97,28 @@ class TestCLIExerciseCommands:
 class TestCLIProgramCommands:
     """Test program-related CLI commands."""
 
-    def test_program_import_samples(self, temp_db: str) -> None:
+    @pytest.mark.slow
+    def test_program_import_samples(self, cli: Callable[..., Result]) -> None:
         """Test importing sample programs."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "program", "import-samples"])
+        result = cli("program", "import-samples")
 
         assert result.exit_code == 0
         assert "Successfully loaded" in result.stdout
 
-    def test_program_list(self, temp_db: str) -> None:
+    def test_program_list(
+        self, initialized_db_with_samples: str, run: Callable[..., Result]
+    ) -> None:
         """Test listing programs."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-        runner.invoke(app, ["--db-path", temp_db, "program", "import-samples"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "program", "list"])
+        result = run(["--db-path", initialized_db_with_samples, "program", "list"])
 
         assert result.exit_code == 0
         assert "PPL" in result.stdout or "Programs" in result.stdout
 
-    def test_program_show(self, temp_db: str) -> None:
+    def test_program_show(
+        self, initialized_db_with_samples: str, run: Callable[..., Result]
+    ) -> None:
         """Test showing program details."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-        runner.invoke(app, ["--db-path", temp_db, "program", "import-samples"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "program", "show", "PPL 6-Day"])
+        result = run(["--db-path", initialized_db_with_samples, "program", "show", "PPL 6-Day"])
 
         assert result.exit_code == 0
         assert "PPL 6-DAY" in result.stdout
@@ -160,22 +127,17 @@ class TestCLIProgramCommands:
 class TestCLIBodyCommands:
     """Test body tracking CLI commands."""
 
-    def test_body_weight_log(self, temp_db: str) -> None:
+    def test_body_weight_log(self, cli: Callable[..., Result]) -> None:
         """Test logging bodyweight."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "body", "weight", "185"])
+        result = cli("body", "weight", "185")
 
         assert result.exit_code == 0
         assert "185" in result.stdout
         assert "Weight logged" in result.stdout
 
-    def test_body_latest(self, temp_db: str) -> None:
+    def test_body_latest(self, db_with_weight_180: str, run: Callable[..., Result]) -> None:
         """Test showing latest measurement."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-        runner.invoke(app, ["--db-path", temp_db, "body", "weight", "180"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "body", "latest"])
+        result = run(["--db-path", db_with_weight_180, "body", "latest"])
 
         assert result.exit_code == 0
         assert "180" in result.stdout
@@ -184,155 +146,110 @@ class TestCLIBodyCommands:
 class TestCLIConfigCommands:
     """Test configuration CLI commands."""
 
-    def test_config_list(self, temp_db: str) -> None:
+    def test_config_list(self, cli_ro: Callable[..., Result]) -> None:
         """Test listing configuration."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "config", "list"])
+        result = cli_ro("config", "list")
 
         assert result.exit_code == 0
         assert "CONFIGURATION" in result.stdout
         assert "default_weight_unit" in result.stdout
 
-    def test_config_get(self, temp_db: str) -> None:
+    def test_config_get(self, cli_ro: Callable[..., Result]) -> None:
         """Test getting a config value."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "config", "get", "default_weight_unit"])
+        result = cli_ro("config", "get", "default_weight_unit")
 
         assert result.exit_code == 0
         assert "lbs" in result.stdout
 
-    def test_config_set(self, temp_db: str) -> None:
+    def test_config_set(self, cli: Callable[..., Result]) -> None:
         """Test setting a config value."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(
-            app, ["--db-path", temp_db, "config", "set", "default_weight_unit", "kg"]
-        )
+        result = cli("config", "set", "default_weight_unit", "kg")
 
         assert result.exit_code == 0
         assert "Configuration updated" in result.stdout
 
         # Verify the change
-        result = runner.invoke(app, ["--db-path", temp_db, "config", "get", "default_weight_unit"])
+        result = cli("config", "get", "default_weight_unit")
         assert "kg" in result.stdout
 
 
 class TestCLIDataCommands:
     """Test data management CLI commands."""
 
-    def test_data_export_json(self, temp_db: str, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_data_export_json(self, tmp_path: Path, cli: Callable[..., Result]) -> None:
         """Test exporting data to JSON."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
         export_path = tmp_path / "export.json"
 
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                temp_db,
-                "data",
-                "export",
-                "--format",
-                "json",
-                "--output",
-                str(export_path),
-            ],
-        )
+        result = cli("data", "export", "--format", "json", "--output", str(export_path))
 
         assert result.exit_code == 0
         assert export_path.exists()
         assert export_path.stat().st_size > 0
 
-    def test_data_backup(self, temp_db: str, tmp_path: Path) -> None:
+    def test_data_backup(self, tmp_path: Path, cli: Callable[..., Result]) -> None:
         """Test database backup."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
         backup_path = tmp_path / "backup"
 
-        result = runner.invoke(
-            app,
-            ["--db-path", temp_db, "data", "backup", "--output", str(backup_path)],
-        )
+        result = cli("data", "backup", "--output", str(backup_path))
 
         assert result.exit_code == 0
         assert backup_path.exists()
 
-    def test_data_optimize(self, temp_db: str) -> None:
+    def test_data_optimize(self, cli: Callable[..., Result]) -> None:
         """Test database optimization."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "data", "optimize"])
+        result = cli("data", "optimize")
 
         assert result.exit_code == 0
         assert "optimized" in result.stdout.lower()
 
 
-class TestCLIWorkoutCommands:
-    """Test workout CLI commands."""
-
-    def test_workout_history_empty(self, temp_db: str) -> None:
-        """Test workout history when empty."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "workout", "history"])
-
-        assert result.exit_code == 0
-        # Should show empty or no workouts message
-
-    def test_workout_last_empty(self, temp_db: str) -> None:
-        """Test last workout when no workouts exist."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "workout", "last"])
-
-        # Should handle gracefully (might be exit code 0 or 1 depending on implementation)
-        assert "No workouts" in result.stdout or result.exit_code != 0
-
-
-class TestCLIStatsCommands:
-    """Test statistics CLI commands."""
-
-    def test_stats_summary_empty(self, temp_db: str) -> None:
-        """Test stats summary with no data."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "stats", "summary"])
-
-        assert result.exit_code == 0
-        # Should show 0 workouts or similar
-
-    def test_stats_streak_empty(self, temp_db: str) -> None:
-        """Test training streak with no data."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "stats", "streak"])
+class TestCLIEmptyDatabase:
+    """Test read-only workout and stats commands against a database with no workouts."""
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["workout", "history"], "No workouts"),
+            (["workout", "last"], "No workouts"),
+            (["stats", "summary"], "Workouts: 0"),
+            (["stats", "streak"], "No active streak"),
+        ],
+    )
+    def test_empty_readonly(
+        self,
+        cli_ro: Callable[..., Result],
+        args: list[str],
+        expected: str,
+    ) -> None:
+        """Test each command succeeds and reports the empty state."""
+        result = cli_ro(*args)
 
         assert result.exit_code == 0
+        assert expected in result.stdout
 
 
 class TestCLIGlobalOptions:
     """Test global CLI options."""
 
-    def test_db_path_option(self, temp_db: str) -> None:
+    @pytest.mark.slow
+    def test_db_path_option(self, temp_db: str, run: Callable[..., Result]) -> None:
         """Test custom database path via --db-path option."""
-        result = runner.invoke(app, ["--db-path", temp_db, "init"])
+        result = run(["--db-path", temp_db, "init"])
 
         assert result.exit_code == 0
         assert Path(temp_db).exists()
 
-    def test_help_option(self) -> None:
+    def test_help_option(self, run: Callable[..., Result]) -> None:
         """Test --help option."""
-        result = runner.invoke(app, ["--help"])
+        result = run(["--help"])
 
         assert result.exit_code == 0
         assert "LIFT" in result.stdout or "bodybuilding" in result.stdout
 
-    def test_subcommand_help(self) -> None:
+    def test_subcommand_help(self, run: Callable[..., Result]) -> None:
         """Test help for subcommands."""
-        result = runner.invoke(app, ["exercises", "--help"])
+        result = run(["exercises", "--help"])
 
         assert result.exit_code == 0
         assert "exercises" in result.stdout.lower()
@@ -341,29 +258,23 @@ class TestCLIGlobalOptions:
 class TestCLIErrorHandling:
     """Test CLI error handling."""
 
-    def test_command_without_init(self, temp_db: str) -> None:
+    def test_command_without_init(self, temp_db: str, run: Callable[..., Result]) -> None:
         """Test commands fail gracefully without initialization."""
-        result = runner.invoke(app, ["--db-path", temp_db, "exercises", "list"])
+        result = run(["--db-path", temp_db, "exercises", "list"])
 
         # Should fail or show appropriate error
         assert "not initialized" in result.stdout.lower() or result.exit_code != 0
 
-    def test_invalid_exercise_name(self, temp_db: str) -> None:
+    def test_invalid_exercise_name(self, cli_ro: Callable[..., Result]) -> None:
         """Test handling of invalid exercise name."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(
-            app, ["--db-path", temp_db, "exercises", "info", "NonexistentExercise"]
-        )
+        result = cli_ro("exercises", "info", "NonexistentExercise")
 
         # Should handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
 
-    def test_invalid_program_name(self, temp_db: str) -> None:
+    def test_invalid_program_name(self, cli_ro: Callable[..., Result]) -> None:
         """Test handling of invalid program name."""
-        runner.invoke(app, ["--db-path", temp_db, "init"])
-
-        result = runner.invoke(app, ["--db-path", temp_db, "program", "show", "NonexistentProgram"])
+        result = cli_ro("program", "show", "NonexistentProgram")
 
         # Should handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
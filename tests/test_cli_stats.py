@@ -1,38 +1,18 @@
 """Tests for stats CLI commands."""
 
-from pathlib import Path
+from collections.abc import Callable
 
 import pytest
-from typer.testing import CliRunner
-
-from lift.main import app
-
-
-runner = CliRunner()
-
-
-@pytest.fixture
-def temp_db(tmp_path: Path) -> str:
-    """Create a temporary database path."""
-    db_path = tmp_path / "test.duckdb"
-    return str(db_path)
-
-
-@pytest.fixture
-def initialized_db(temp_db: str) -> str:
-    """Create and initialize a temporary database."""
-    result = runner.invoke(app, ["--db-path", temp_db, "init"])
-    assert result.exit_code == 0
-    return temp_db
+from click.testing import Result
 
 
 @pytest.mark.cli
 class TestStatsSummary:
     """Test stats summary commands."""
 
-    def test_summary_empty(self, initialized_db: str) -> None:
+    def test_summary_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test stats summary with no data."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "summary"])
+        result = cli_ro("stats", "summary")
 
         assert result.exit_code == 0
         # Should show 0 workouts or similar
@@ -43,19 +23,15 @@ class TestStatsSummary:
         # TODO: Rewrite to use only CLI commands for data setup
 
     @pytest.mark.skip(reason="Period parameter not yet implemented in CLI")
-    def test_summary_with_period(self, initialized_db: str) -> None:
+    def test_summary_with_period(self, cli_ro: Callable[..., Result]) -> None:
         """Test stats summary with period parameter."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "stats", "summary", "--period", "month"]
-        )
+        result = cli_ro("stats", "summary", "--period", "month")
 
         assert result.exit_code == 0
 
-    def test_summary_invalid_period(self, initialized_db: str) -> None:
+    def test_summary_invalid_period(self, cli_ro: Callable[..., Result]) -> None:
         """Test stats summary with invalid period."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "stats", "summary", "--period", "invalid"]
-        )
+        result = cli_ro("stats", "summary", "--period", "invalid")
 
         # Should fail or handle gracefully
         assert result.exit_code != 0 or "invalid" in result.stdout.lower()
@@ -65,9 +41,9 @@ class TestStatsSummary:
 class TestStatsExercise:
     """Test exercise statistics commands."""
 
-    def test_exercise_stats_no_exercise(self, initialized_db: str) -> None:
+    def test_exercise_stats_no_exercise(self, cli_ro: Callable[..., Result]) -> None:
         """Test exercise stats when exercise doesn't exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "exercise", "99999"])
+        result = cli_ro("stats", "exercise", "99999")
 
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
 
@@ -81,18 +57,16 @@ class TestStatsExercise:
 class TestStatsVolume:
     """Test volume statistics commands."""
 
-    def test_volume_empty(self, initialized_db: str) -> None:
+    def test_volume_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test volume stats with no data."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "volume"])
+        result = cli_ro("stats", "volume")
 
         assert result.exit_code == 0
         # Should handle empty case
 
-    def test_volume_with_weeks(self, initialized_db: str) -> None:
+    def test_volume_with_weeks(self, cli_ro: Callable[..., Result]) -> None:
         """Test volume stats with weeks parameter."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "stats", "volume", "--weeks", "12"]
-        )
+        result = cli_ro("stats", "volume", "--weeks", "12")
 
         assert result.exit_code == 0
 
@@ -101,18 +75,16 @@ class TestStatsVolume:
 class TestStatsPR:
     """Test PR (personal record) statistics."""
 
-    def test_pr_list_empty(self, initialized_db: str) -> None:
+    def test_pr_list_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test listing PRs when none exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "pr"])
+        result = cli_ro("stats", "pr")
 
         assert result.exit_code == 0
         # Should show no PRs or empty list
 
-    def test_pr_for_exercise_not_found(self, initialized_db: str) -> None:
+    def test_pr_for_exercise_not_found(self, cli_ro: Callable[..., Result]) -> None:
         """Test PRs for non-existent exercise."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "stats", "pr", "--exercise", "99999"]
-        )
+        result = cli_ro("stats", "pr", "--exercise", "99999")
 
         # Should handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
@@ -123,19 +95,17 @@ class TestStatsMuscle:
     """Test muscle volume statistics."""
 
     @pytest.mark.skip(reason="Muscle stats CLI command not yet fully implemented")
-    def test_muscle_volume_empty(self, initialized_db: str) -> None:
+    def test_muscle_volume_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test muscle volume with no data."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "muscle"])
+        result = cli_ro("stats", "muscle")
 
         assert result.exit_code == 0
         # Should handle empty case
 
     @pytest.mark.skip(reason="Muscle stats CLI command not yet fully implemented")
-    def test_muscle_volume_with_weeks(self, initialized_db: str) -> None:
+    def test_muscle_volume_with_weeks(self, cli_ro: Callable[..., Result]) -> None:
         """Test muscle volume with weeks parameter."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "stats", "muscle", "--weeks", "4"]
-        )
+        result = cli_ro("stats", "muscle", "--weeks", "4")
 
         assert result.exit_code == 0
 
@@ -144,9 +114,9 @@ class TestStatsMuscle:
 class TestStatsStreak:
     """Test consistency streak statistics."""
 
-    def test_streak_empty(self, initialized_db: str) -> None:
+    def test_streak_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test streak with no workouts."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "streak"])
+        result = cli_ro("stats", "streak")
 
         assert result.exit_code == 0
         assert "No active streak" in result.stdout or "0" in result.stdout
@@ -161,9 +131,9 @@ class TestStatsStreak:
 class TestStatsProgress:
     """Test progress statistics."""
 
-    def test_progress_no_exercise(self, initialized_db: str) -> None:
+    def test_progress_no_exercise(self, cli_ro: Callable[..., Result]) -> None:
         """Test progress for non-existent exercise."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "stats", "progress", "99999"])
+        result = cli_ro("stats", "progress", "99999")
 
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
 
@@ -1,56 +1,23 @@
 """Tests for workout CLI commands."""
 
-from pathlib import Path
+from collections.abc import Callable
 
 import pytest
-from typer.testing import CliRunner
-
-from lift.main import app
-
-
-runner = CliRunner()
-
-
-@pytest.fixture
-def temp_db(tmp_path: Path) -> str:
-    """Create a temporary database path."""
-    db_path = tmp_path / "test.duckdb"
-    return str(db_path)
-
-
-@pytest.fixture
-def initialized_db(temp_db: str) -> str:
-    """Create and initialize a temporary database."""
-    result = runner.invoke(app, ["--db-path", temp_db, "init"])
-    assert result.exit_code == 0
-    return temp_db
+from click.testing import Result
 
 
 @pytest.mark.cli
 class TestWorkoutListCommands:
     """Test workout list and history commands."""
 
-    def test_workout_incomplete_empty(self, initialized_db: str) -> None:
+    def test_workout_incomplete_empty(self, cli_ro: Callable[..., Result]) -> None:
         """Test listing incomplete workouts when none exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "workout", "incomplete"])
+        # Empty history/last are covered by test_cli_integration and the service tests
+        result = cli_ro("workout", "incomplete")
 
         assert result.exit_code == 0
         assert "No incomplete workouts" in result.stdout
 
-    def test_workout_history_empty(self, initialized_db: str) -> None:
-        """Test workout history when no workouts exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "workout", "history"])
-
-        assert result.exit_code == 0
-        # Should succeed even with no workouts
-
-    def test_workout_last_empty(self, initialized_db: str) -> None:
-        """Test getting last workout when none exists."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "workout", "last"])
-
-        assert result.exit_code == 0
-        assert "No workouts found" in result.stdout or "No recent workout" in result.stdout
-
 
 @pytest.mark.cli
 class TestWorkoutLog:
@@ -66,20 +33,16 @@ class TestWorkoutLog:
 class TestWorkoutCompletion:
     """Test workout completion and abandonment."""
 
-    def test_complete_nonexistent_workout(self, initialized_db: str) -> None:
+    def test_complete_nonexistent_workout(self, cli_ro: Callable[..., Result]) -> None:
         """Test completing a workout that doesn't exist."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "workout", "complete", "--id", "99999"]
-        )
+        result = cli_ro("workout", "complete", "--id", "99999")
 
         # Should fail gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
 
-    def test_abandon_nonexistent_workout(self, initialized_db: str) -> None:
+    def test_abandon_nonexistent_workout(self, cli_ro: Callable[..., Result]) -> None:
         """Test abandoning a workout that doesn't exist."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "workout", "abandon", "--id", "99999"]
-        )
+        result = cli_ro("workout", "abandon", "--id", "99999")
 
         # Should fail gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
@@ -89,11 +52,9 @@ class TestWorkoutCompletion:
 class TestWorkoutDelete:
     """Test workout deletion."""
 
-    def test_delete_nonexistent_workout(self, initialized_db: str) -> None:
+    def test_delete_nonexistent_workout(self, cli_ro: Callable[..., Result]) -> None:
         """Test deleting a workout that doesn't exist."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "workout", "delete", "99999"], input="y\n"
-        )
+        result = cli_ro("workout", "delete", "99999", input="y\n")
 
         # Should handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
@@ -129,18 +90,16 @@ class TestWorkoutResume:
     """Test workout resume functionality."""
 
     @pytest.mark.skip(reason="Resume command implementation needs verification")
-    def test_resume_no_incomplete(self, initialized_db: str) -> None:
+    def test_resume_no_incomplete(self, cli_ro: Callable[..., Result]) -> None:
         """Test resuming when no incomplete workouts exist."""
-        result = runner.invoke(app, ["--db-path", initialized_db, "workout", "resume"])
+        result = cli_ro("workout", "resume")
 
         assert result.exit_code == 0
         assert "No incomplete workouts" in result.stdout
 
-    def test_resume_with_id_not_found(self, initialized_db: str) -> None:
+    def test_resume_with_id_not_found(self, cli_ro: Callable[..., Result]) -> None:
         """Test resuming with invalid workout ID."""
-        result = runner.invoke(
-            app, ["--db-path", initialized_db, "workout", "resume", "--id", "99999"]
-        )
+        result = cli_ro("workout", "resume", "--id", "99999")
 
         # Should handle gracefully
         assert result.exit_code != 0 or "not found" in result.stdout.lower()
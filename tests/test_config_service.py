@@ -1,31 +1,36 @@
 """Tests for configuration service."""
 
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
 
-from lift.core.database import DatabaseManager, reset_db_instance
+from lift.core.database import DatabaseManager
 from lift.core.models import MeasurementUnit, WeightUnit
 from lift.services.config_service import ConfigService
 
 
+@pytest.fixture(scope="module")
+def db(_template_db: Path, tmp_path_factory: pytest.TempPathFactory) -> DatabaseManager:
+    """Create one test database shared by every test in this module."""
+    db_path = tmp_path_factory.mktemp("config") / "test.duckdb"
+    shutil.copyfile(_template_db, db_path)
+    return DatabaseManager(str(db_path))
+
+
 @pytest.fixture
-def db():
-    """Create a temporary test database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.duckdb"
-        reset_db_instance()
-        db = DatabaseManager(str(db_path))
-        db.initialize_database()
-        yield db
-        reset_db_instance()
-
-
-def test_get_setting(db):
-    """Test getting a setting value."""
-    config_service = ConfigService(db)
+def config_service(db_rollback: DatabaseManager) -> ConfigService:
+    """Create config service instance whose writes are rolled back after each test."""
+    return ConfigService(db_rollback)
+
 
+def _bulk_set(db: DatabaseManager, pairs: list[tuple[str, str]]) -> None:
+    """Write several settings in one batched statement, bypassing the service."""
+    db.execute_many("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", pairs)
+
+
+def test_get_setting(config_service):
+    """Test getting a setting value."""
     # Get existing setting (from defaults)
     value = config_service.get_setting("default_weight_unit")
     assert value == "lbs"
@@ -35,10 +40,31 @@ def test_get_setting(db):
     assert value is None
 
 
-def test_set_setting(db):
-    """Test setting a configuration value."""
-    config_service = ConfigService(db)
+def test_get_setting_is_cached(db, config_service, monkeypatch):
+    """Test repeated reads are served from the service cache until it writes."""
+    connections_opened = 0
+    get_connection = db.get_connection
+
+    def counting_get_connection():
+        nonlocal connections_opened
+        connections_opened += 1
+        return get_connection()
+
+    monkeypatch.setattr(db, "get_connection", counting_get_connection)
+
+    assert config_service.get_setting("enable_tempo") == "false"
+    assert config_service.get_setting("enable_tempo") == "false"
+    assert connections_opened == 1
+
+    # Writing through the service invalidates the cached value
+    config_service.set_setting("enable_tempo", "yes")
+    opened_before_read = connections_opened
+    assert config_service.get_setting("enable_tempo") == "yes"
+    assert connections_opened == opened_before_read + 1
+
 
+def test_set_setting(config_service):
+    """Test setting a configuration value."""
     # Set new setting
     setting = config_service.set_setting("test_key", "test_value", "Test description")
 
@@ -51,10 +77,8 @@ def test_set_setting(db):
     assert value == "test_value"
 
 
-def test_update_setting(db):
+def test_update_setting(config_service):
     """Test updating an existing setting."""
-    config_service = ConfigService(db)
-
     # Set initial value
     config_service.set_setting("test_key", "initial_value")
 
@@ -68,10 +92,8 @@ def test_update_setting(db):
     assert value == "updated_value"
 
 
-def test_get_all_settings(db):
+def test_get_all_settings(config_service):
     """Test getting all settings."""
-    config_service = ConfigService(db)
-
     settings = config_service.get_all_settings()
 
     # Should include defaults
@@ -89,10 +111,8 @@ def test_get_all_settings(db):
     assert settings["custom_key"] == "custom_value"
 
 
-def test_get_all_settings_detailed(db):
+def test_get_all_settings_detailed(config_service):
     """Test getting all settings with details."""
-    config_service = ConfigService(db)
-
     settings = config_service.get_all_settings_detailed()
 
     assert isinstance(settings, list)
@@ -106,10 +126,8 @@ def test_get_all_settings_detailed(db):
         assert hasattr(setting, "updated_at")
 
 
-def test_delete_setting(db):
+def test_delete_setting(config_service):
     """Test deleting a setting."""
-    config_service = ConfigService(db)
-
     # Set a custom setting
     config_service.set_setting("to_delete", "value")
 
@@ -121,26 +139,22 @@ def test_delete_setting(db):
     deleted = config_service.delete_setting("to_delete")
     assert deleted is True
 
-    # Verify it's gone from database
-    with db.get_connection() as conn:
-        result = conn.execute("SELECT key FROM settings WHERE key = 'to_delete'").fetchone()
-        assert result is None
+    # Verify it's gone (not a default, so no fallback value either)
+    assert config_service.get_setting("to_delete") is None
 
     # Delete non-existent setting
     deleted = config_service.delete_setting("nonexistent")
     assert deleted is False
 
 
-def test_reset_to_defaults(db):
+def test_reset_to_defaults(db, config_service):
     """Test resetting all settings to defaults."""
-    config_service = ConfigService(db)
-
-    # Set some custom settings
-    config_service.set_setting("custom1", "value1")
-    config_service.set_setting("custom2", "value2")
-
-    # Modify a default
-    config_service.set_setting("default_weight_unit", "kg")
+    # Set some custom settings and modify a default
+    _bulk_set(
+        db,
+        [("custom1", "value1"), ("custom2", "value2"), ("default_weight_unit", "kg")],
+    )
+    assert config_service.get_setting("default_weight_unit") == "kg"
 
     # Reset to defaults
     config_service.reset_to_defaults()
@@ -154,129 +168,75 @@ def test_reset_to_defaults(db):
     assert value is None
 
 
-def test_get_default_weight_unit(db):
-    """Test getting default weight unit."""
-    config_service = ConfigService(db)
-
-    # Default should be LBS
-    unit = config_service.get_default_weight_unit()
-    assert unit == WeightUnit.LBS
-
-    # Change to KG
-    config_service.set_setting("default_weight_unit", "kg")
-    unit = config_service.get_default_weight_unit()
-    assert unit == WeightUnit.KG
-
-    # Test case insensitivity
-    config_service.set_setting("default_weight_unit", "KG")
-    unit = config_service.get_default_weight_unit()
-    assert unit == WeightUnit.KG
-
-
-def test_get_default_measurement_unit(db):
-    """Test getting default measurement unit."""
-    config_service = ConfigService(db)
-
-    # Default should be INCHES
-    unit = config_service.get_default_measurement_unit()
-    assert unit == MeasurementUnit.INCHES
-
-    # Change to CM
-    config_service.set_setting("default_measurement_unit", "cm")
-    unit = config_service.get_default_measurement_unit()
-    assert unit == MeasurementUnit.CENTIMETERS
-
-
-def test_is_rpe_enabled(db):
-    """Test checking if RPE is enabled."""
-    config_service = ConfigService(db)
-
-    # Default should be enabled
-    enabled = config_service.is_rpe_enabled()
-    assert enabled is True
-
-    # Disable it
-    config_service.set_setting("enable_rpe", "false")
-    enabled = config_service.is_rpe_enabled()
-    assert enabled is False
-
-    # Test various true values
-    for value in ["true", "True", "TRUE", "1", "yes"]:
-        config_service.set_setting("enable_rpe", value)
-        assert config_service.is_rpe_enabled() is True
-
-    # Test various false values
-    for value in ["false", "False", "FALSE", "0", "no"]:
-        config_service.set_setting("enable_rpe", value)
-        assert config_service.is_rpe_enabled() is False
-
-
-def test_is_tempo_enabled(db):
-    """Test checking if tempo tracking is enabled."""
-    config_service = ConfigService(db)
-
-    # Default should be disabled
-    enabled = config_service.is_tempo_enabled()
-    assert enabled is False
-
-    # Enable it
-    config_service.set_setting("enable_tempo", "true")
-    enabled = config_service.is_tempo_enabled()
-    assert enabled is True
-
-
-def test_get_rest_timer_default(db):
-    """Test getting default rest timer."""
-    config_service = ConfigService(db)
-
-    # Default should be 90 seconds
-    timer = config_service.get_rest_timer_default()
-    assert timer == 90
-
-    # Change it
-    config_service.set_setting("rest_timer_default", "120")
-    timer = config_service.get_rest_timer_default()
-    assert timer == 120
-
-    # Test invalid value (should return default)
-    config_service.set_setting("rest_timer_default", "invalid")
-    timer = config_service.get_rest_timer_default()
-    assert timer == 90
-
-
-def test_is_auto_pr_detection_enabled(db):
-    """Test checking if auto PR detection is enabled."""
-    config_service = ConfigService(db)
-
-    # Default should be enabled
-    enabled = config_service.is_auto_pr_detection_enabled()
-    assert enabled is True
-
-    # Disable it
-    config_service.set_setting("auto_detect_pr", "false")
-    enabled = config_service.is_auto_pr_detection_enabled()
-    assert enabled is False
-
-
-def test_settings_persistence(db):
+@pytest.mark.parametrize(
+    ("accessor", "expected"),
+    [
+        ("get_default_weight_unit", WeightUnit.LBS),
+        ("get_default_measurement_unit", MeasurementUnit.INCHES),
+        ("is_rpe_enabled", True),
+        ("is_tempo_enabled", False),
+        ("get_rest_timer_default", 90),
+        ("is_auto_pr_detection_enabled", True),
+    ],
+)
+def test_accessor_default(config_service, accessor, expected):
+    """Test typed setting accessors on a fresh database."""
+    assert getattr(config_service, accessor)() == expected
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "accessor", "expected"),
+    [
+        ("default_weight_unit", "kg", "get_default_weight_unit", WeightUnit.KG),
+        ("default_weight_unit", "KG", "get_default_weight_unit", WeightUnit.KG),
+        (
+            "default_measurement_unit",
+            "cm",
+            "get_default_measurement_unit",
+            MeasurementUnit.CENTIMETERS,
+        ),
+        ("enable_rpe", "false", "is_rpe_enabled", False),
+        ("enable_tempo", "true", "is_tempo_enabled", True),
+        ("rest_timer_default", "120", "get_rest_timer_default", 120),
+        ("rest_timer_default", "invalid", "get_rest_timer_default", 90),
+        ("auto_detect_pr", "false", "is_auto_pr_detection_enabled", False),
+    ],
+)
+def test_accessor_after_set(config_service, key, value, accessor, expected):
+    """Test typed setting accessors after changing the underlying setting."""
+    config_service.set_setting(key, value)
+    assert getattr(config_service, accessor)() == expected
+
+
+@pytest.mark.parametrize("value", ["true", "True", "TRUE", "1", "yes"])
+def test_is_rpe_enabled_true_values(config_service, value):
+    """Test values that enable RPE tracking."""
+    config_service.set_setting("enable_rpe", value)
+    assert config_service.is_rpe_enabled() is True
+
+
+@pytest.mark.parametrize("value", ["false", "False", "FALSE", "0", "no"])
+def test_is_rpe_enabled_false_values(config_service, value):
+    """Test values that disable RPE tracking."""
+    config_service.set_setting("enable_rpe", value)
+    assert config_service.is_rpe_enabled() is False
+
+
+def test_settings_persistence(config_service):
     """Test that settings persist across service instances."""
-    config_service1 = ConfigService(db)
-
     # Set a value
-    config_service1.set_setting("persist_test", "persisted_value")
+    config_service.set_setting("persist_test", "persisted_value")
 
     # Create new service instance
-    config_service2 = ConfigService(db)
+    config_service2 = ConfigService(config_service.db)
 
     # Verify value persisted
     value = config_service2.get_setting("persist_test")
     assert value == "persisted_value"
 
 
-def test_setting_without_description(db):
+def test_setting_without_description(config_service):
     """Test setting a value without description."""
-    config_service = ConfigService(db)
-
     # Set without description
     setting = config_service.set_setting("no_desc", "value")
 
@@ -285,10 +245,8 @@ def test_setting_without_description(db):
     assert setting.description is None
 
 
-def test_update_setting_with_new_description(db):
+def test_update_setting_with_new_description(config_service):
     """Test updating a setting and adding description."""
-    config_service = ConfigService(db)
-
     # Set without description
     config_service.set_setting("test", "value")
 
@@ -15,30 +15,47 @@ from lift.utils.conversions import (
 )
 
 
+# (input, expected) pairs; built once at import and shared by the parametrized tests
+_LBS_TO_KG_CASES = [
+    (Decimal("185.2"), Decimal("84.01")),  # 185.2 * 0.45359237 = 84.005... rounds to 84.01
+    (Decimal("0"), Decimal("0.00")),
+    (Decimal("1"), Decimal("0.45")),
+    (Decimal("220.5"), Decimal("100.02")),
+]
+_KG_TO_LBS_CASES = [
+    (Decimal("84.00"), Decimal("185.19")),
+    (Decimal("0"), Decimal("0.00")),
+    (Decimal("1"), Decimal("2.20")),
+    (Decimal("100"), Decimal("220.46")),
+]
+_INCHES_TO_CM_CASES = [
+    (Decimal("15.5"), Decimal("39.37")),
+    (Decimal("0"), Decimal("0.00")),
+    (Decimal("1"), Decimal("2.54")),
+    (Decimal("42.5"), Decimal("107.95")),
+]
+_CM_TO_INCHES_CASES = [
+    (Decimal("39.37"), Decimal("15.50")),
+    (Decimal("0"), Decimal("0.00")),
+    (Decimal("2.54"), Decimal("1.00")),
+    (Decimal("100"), Decimal("39.37")),
+]
+
+_PRECISION_INPUTS = tuple(Decimal(s) for s in ("185.2", "185.25", "185.255", "185.2555"))
+
+
 class TestWeightConversions:
     """Test weight conversion functions."""
 
-    def test_lbs_to_kg(self) -> None:
+    @pytest.mark.parametrize(("lbs", "expected"), _LBS_TO_KG_CASES)
+    def test_lbs_to_kg(self, lbs: Decimal, expected: Decimal) -> None:
         """Test pounds to kilograms conversion."""
-        # Standard conversion (185.2 * 0.45359237 = 84.005... rounds to 84.01)
-        result = lbs_to_kg(Decimal("185.2"))
-        assert result == Decimal("84.01")
+        assert lbs_to_kg(lbs) == expected
 
-        # Edge cases
-        assert lbs_to_kg(Decimal("0")) == Decimal("0.00")
-        assert lbs_to_kg(Decimal("1")) == Decimal("0.45")
-        assert lbs_to_kg(Decimal("220.5")) == Decimal("100.02")
-
-    def test_kg_to_lbs(self) -> None:
+    @pytest.mark.parametrize(("kg", "expected"), _KG_TO_LBS_CASES)
+    def test_kg_to_lbs(self, kg: Decimal, expected: Decimal) -> None:
         """Test kilograms to pounds conversion."""
-        # Standard conversion
-        result = kg_to_lbs(Decimal("84.00"))
-        assert result == Decimal("185.19")
-
-        # Edge cases
-        assert kg_to_lbs(Decimal("0")) == Decimal("0.00")
-        assert kg_to_lbs(Decimal("1")) == Decimal("2.20")
-        assert kg_to_lbs(Decimal("100")) == Decimal("220.46")
+        assert kg_to_lbs(kg) == expected
 
     def test_weight_conversion_roundtrip(self) -> None:
         """Test that converting back and forth maintains precision."""
@@ -47,7 +64,7 @@ class TestWeightConversions:
         back_to_lbs = kg_to_lbs(kg)
 
         # Allow small rounding difference
-        assert abs(back_to_lbs - original) < Decimal("0.1")
+        assert float(back_to_lbs) == pytest.approx(float(original), abs=0.1)
 
     def test_weight_conversion_precision(self) -> None:
         """Test that conversions are rounded to 2 decimal places."""
@@ -61,27 +78,15 @@ class TestWeightConversions:
 class TestMeasurementConversions:
     """Test body measurement conversion functions."""
 
-    def test_inches_to_cm(self) -> None:
+    @pytest.mark.parametrize(("inches", "expected"), _INCHES_TO_CM_CASES)
+    def test_inches_to_cm(self, inches: Decimal, expected: Decimal) -> None:
         """Test inches to centimeters conversion."""
-        # Standard conversion
-        result = inches_to_cm(Decimal("15.5"))
-        assert result == Decimal("39.37")
-
-        # Edge cases
-        assert inches_to_cm(Decimal("0")) == Decimal("0.00")
-        assert inches_to_cm(Decimal("1")) == Decimal("2.54")
-        assert inches_to_cm(Decimal("42.5")) == Decimal("107.95")
+        assert inches_to_cm(inches) == expected
 
-    def test_cm_to_inches(self) -> None:
+    @pytest.mark.parametrize(("cm", "expected"), _CM_TO_INCHES_CASES)
+    def test_cm_to_inches(self, cm: Decimal, expected: Decimal) -> None:
         """Test centimeters to inches conversion."""
-        # Standard conversion
-        result = cm_to_inches(Decimal("39.37"))
-        assert result == Decimal("15.50")
-
-        # Edge cases
-        assert cm_to_inches(Decimal("0")) == Decimal("0.00")
-        assert cm_to_inches(Decimal("2.54")) == Decimal("1.00")
-        assert cm_to_inches(Decimal("100")) == Decimal("39.37")
+        assert cm_to_inches(cm) == expected
 
     def test_measurement_conversion_roundtrip(self) -> None:
         """Test that converting back and forth maintains precision."""
@@ -90,7 +95,7 @@ class TestMeasurementConversions:
         back_to_inches = cm_to_inches(cm)
 
         # Should be very close to original
-        assert abs(back_to_inches - original) < Decimal("0.1")
+        assert float(back_to_inches) == pytest.approx(float(original), abs=0.1)
 
     def test_measurement_conversion_precision(self) -> None:
         """Test that conversions are rounded to 2 decimal places."""
@@ -199,17 +204,7 @@ class TestEdgeCases:
         assert result > Decimal("0")
         assert result.as_tuple().exponent == -2
 
-    def test_decimal_precision(self) -> None:
-        """Test that decimal precision is maintained."""
-        # Test with various decimal places
-        values = [
-            Decimal("185.2"),
-            Decimal("185.25"),
-            Decimal("185.255"),
-            Decimal("185.2555"),
-        ]
-
-        for value in values:
-            result = lbs_to_kg(value)
-            # All should round to 2 decimal places
-            assert result.as_tuple().exponent == -2
+    @pytest.mark.parametrize("value", _PRECISION_INPUTS)
+    def test_decimal_precision(self, value: Decimal) -> None:
+        """Test that inputs with any number of decimal places round to 2."""
+        assert lbs_to_kg(value).as_tuple().exponent == -2
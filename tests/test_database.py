@@ -0,0 +1,93 @@
+"""Tests for the database manager."""
+
+import io
+from decimal import Decimal
+from pathlib import Path
+
+from lift.core.database import DatabaseManager
+from lift.core.models import SetCreate, SetType, WorkoutCreate
+from lift.services.body_service import BodyService
+from lift.services.config_service import ConfigService
+from lift.services.exercise_service import ExerciseService
+from lift.services.export_service import ExportService
+from lift.services.pr_service import PRService
+from lift.services.set_service import SetService
+from lift.services.workout_service import WorkoutService
+
+
+def test_in_memory_database_persists_across_connections() -> None:
+    """Test that every connection of an in-memory manager sees the same database."""
+    db = DatabaseManager(":memory:")
+    db.initialize_database()
+
+    assert db.database_exists()
+    ConfigService(db).set_setting("memory_key", "value")
+    assert ConfigService(db).get_setting("memory_key") == "value"
+
+
+def test_in_memory_databases_are_isolated() -> None:
+    """Test that separate in-memory managers do not share tables."""
+    first = DatabaseManager(":memory:")
+    first.initialize_database()
+
+    assert not DatabaseManager(":memory:").database_exists()
+
+
+def test_in_memory_database_info() -> None:
+    """Test that database info for an in-memory manager reports no file size."""
+    db = DatabaseManager(":memory:")
+    db.initialize_database()
+
+    info = db.get_database_info()
+
+    assert info["database_size_mb"] == 0
+    assert info["tables"]["exercises"] == 0
+
+
+def test_nested_connections_share_outer_connection(tmp_path: Path) -> None:
+    """Test that nested get_connection() blocks reuse the outer connection."""
+    db = DatabaseManager(str(tmp_path / "nested.duckdb"), reuse_connection=False)
+
+    with db.get_connection() as outer, db.get_connection() as inner:
+        assert inner is outer
+
+    # Once the outer block exits, the next block opens a fresh connection
+    with db.get_connection() as conn:
+        assert conn is not outer
+
+
+def test_services_on_per_call_connections(initialized_db: str) -> None:
+    """
+    Test a workout flow on the production connection path.
+
+    The rest of the suite shares one cached connection per database; this manager
+    opens a connection per get_connection() block with DuckDB's default settings.
+    """
+    db = DatabaseManager(initialized_db, reuse_connection=False)
+
+    bench = ExerciseService(db).get_by_name("Barbell Bench Press")
+    assert bench is not None
+
+    workout_service = WorkoutService(db)
+    workout = workout_service.create_workout(WorkoutCreate(name="Push Day"))
+    SetService(db).add_set(
+        SetCreate(
+            workout_id=workout.id,
+            exercise_id=bench.id,
+            set_number=1,
+            weight=Decimal("185"),
+            reps=5,
+            set_type=SetType.WORKING,
+        )
+    )
+    workout_service.finish_workout(workout.id, duration_minutes=45)
+    assert PRService(db).auto_detect_prs(workout.id)
+
+    body_service = BodyService(db)
+    first = body_service.log_weight(Decimal("180"))
+    second = body_service.log_weight(Decimal("182.5"))
+    comparison = body_service.compare_measurements(second.id, first.id)
+    assert comparison["differences"]["weight"]["change"] == Decimal("2.5")
+
+    summary = ExportService(db).export_all_to_json_stream(io.StringIO())
+    assert summary["sets"] == 1
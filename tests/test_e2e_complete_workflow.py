@@ -4,9 +4,10 @@ End-to-end tests for complete user workflows.
 These tests verify that all slices work together properly in realistic scenarios.
 """
 
+import io
+import json
 from datetime import datetime, timedelta
 from decimal import Decimal
-from pathlib import Path
 
 from lift.core.database import DatabaseManager
 from lift.core.models import (
@@ -193,8 +194,8 @@ class TestCompleteUserJourney:
             (Decimal("185"), 8, Decimal("9.5")),
         ]
 
-        for i, (weight, reps, rpe) in enumerate(bench_sets, 1):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout1.id,
                     exercise_id=exercise_ids["Barbell Bench Press"],
@@ -204,7 +205,9 @@ class TestCompleteUserJourney:
                     rpe=rpe,
                     set_type=SetType.WORKING,
                 )
-            )
+                for i, (weight, reps, rpe) in enumerate(bench_sets, 1)
+            ]
+        )
 
         # Log sets for overhead press
         ohp_sets = [
@@ -213,8 +216,8 @@ class TestCompleteUserJourney:
             (Decimal("115"), 8, Decimal("9.0")),
         ]
 
-        for i, (weight, reps, rpe) in enumerate(ohp_sets, 1):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout1.id,
                     exercise_id=exercise_ids["Overhead Press"],
@@ -224,7 +227,9 @@ class TestCompleteUserJourney:
                     rpe=rpe,
                     set_type=SetType.WORKING,
                 )
-            )
+                for i, (weight, reps, rpe) in enumerate(ohp_sets, 1)
+            ]
+        )
 
         # Finish workout
         workout_service.finish_workout(workout1.id, duration_minutes=65)
@@ -254,8 +259,8 @@ class TestCompleteUserJourney:
             (Decimal("190"), 9, Decimal("9.5")),
         ]
 
-        for i, (weight, reps, rpe) in enumerate(bench_sets_week2, 1):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout2.id,
                     exercise_id=exercise_ids["Barbell Bench Press"],
@@ -265,7 +270,9 @@ class TestCompleteUserJourney:
                     rpe=rpe,
                     set_type=SetType.WORKING,
                 )
-            )
+                for i, (weight, reps, rpe) in enumerate(bench_sets_week2, 1)
+            ]
+        )
 
         workout_service.finish_workout(workout2.id, duration_minutes=68)
 
@@ -291,8 +298,8 @@ class TestCompleteUserJourney:
             (Decimal("195"), 8, Decimal("10.0")),  # Pushed to failure
         ]
 
-        for i, (weight, reps, rpe) in enumerate(bench_sets_week3, 1):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout3.id,
                     exercise_id=exercise_ids["Barbell Bench Press"],
@@ -302,7 +309,9 @@ class TestCompleteUserJourney:
                     rpe=rpe,
                     set_type=SetType.WORKING if i < 4 else SetType.FAILURE,
                 )
-            )
+                for i, (weight, reps, rpe) in enumerate(bench_sets_week3, 1)
+            ]
+        )
 
         workout_service.finish_workout(workout3.id, duration_minutes=70)
 
@@ -362,23 +371,16 @@ class TestCompleteUserJourney:
         assert streak > 0  # Should have a streak
 
         # Step 12: Export data
-        import tempfile
-
         from lift.services.export_service import ExportService
 
         export_service = ExportService(db)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            export_path = f.name
+        buf = io.StringIO()
+        summary = export_service.export_all_to_json_stream(buf)
 
-        try:
-            export_service.export_all_to_json(export_path)
-
-            # Verify export file exists and has content
-            assert Path(export_path).exists()
-            assert Path(export_path).stat().st_size > 0
-        finally:
-            Path(export_path).unlink(missing_ok=True)
+        # Verify export has content
+        assert buf.tell() > 0
+        assert summary["sets"] == 15
 
         # Step 13: Verify progression recommendations
 
@@ -470,8 +472,8 @@ class TestCompleteUserJourney:
         # Log sets following the program prescription
         from lift.core.models import SetCreate
 
-        for set_num in range(1, 6):  # 5 sets as prescribed
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout.id,
                     exercise_id=exercise.id,
@@ -481,7 +483,9 @@ class TestCompleteUserJourney:
                     rpe=Decimal("9.0") if set_num < 5 else Decimal("9.5"),
                     set_type=SetType.WORKING,
                 )
-            )
+                for set_num in range(1, 6)  # 5 sets as prescribed
+            ]
+        )
 
         # Finish workout
         workout_service.finish_workout(workout.id, duration_minutes=45)
@@ -522,8 +526,8 @@ class TestCompleteUserJourney:
         )
 
         # Log 3 sets
-        for i in range(1, 4):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout.id,
                     exercise_id=exercise.id,
@@ -533,7 +537,9 @@ class TestCompleteUserJourney:
                     rpe=Decimal("8.0"),
                     set_type=SetType.WORKING,
                 )
-            )
+                for i in range(1, 4)
+            ]
+        )
 
         workout_service.finish_workout(workout.id, duration_minutes=60)
 
@@ -549,27 +555,16 @@ class TestCompleteUserJourney:
         assert len(prs) > 0
 
         # Verify export includes the workout
-        import tempfile
-
         from lift.services.export_service import ExportService
 
         export_service = ExportService(db)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            export_path = f.name
-
-        try:
-            export_service.export_to_json("workouts", export_path)
-
-            import json
-
-            with open(export_path) as f:
-                data = json.load(f)
+        buf = io.StringIO()
+        export_service.export_to_json_stream("workouts", buf)
+        data = json.loads(buf.getvalue())
 
-            assert len(data) == 1
-            assert data[0]["name"] == "Leg Day"
-        finally:
-            Path(export_path).unlink(missing_ok=True)
+        assert len(data) == 1
+        assert data[0]["name"] == "Leg Day"
 
         # Delete workout and verify cascade
         workout_service.delete_workout(workout.id)
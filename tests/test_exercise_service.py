@@ -1,12 +1,9 @@
 """Tests for ExerciseService."""
 
-import json
-import tempfile
-from pathlib import Path
-
+import orjson
 import pytest
 
-from lift.core.database import DatabaseManager, reset_db_instance
+from lift.core.database import DatabaseManager
 from lift.core.models import (
     CategoryType,
     EquipmentType,
@@ -17,32 +14,27 @@ from lift.core.models import (
 from lift.services.exercise_service import ExerciseService
 
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    # Create temp file and delete it so DuckDB can create it fresh
-    temp_file = tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False)
-    db_path = temp_file.name
-    temp_file.close()
-    Path(db_path).unlink()  # Delete empty file
-
-    # Reset the global instance to ensure clean state
-    reset_db_instance()
-
-    db = DatabaseManager(db_path)
+@pytest.fixture(scope="module")
+def db() -> DatabaseManager:
+    """Create one in-memory test database shared by every test in this module."""
+    db = DatabaseManager(":memory:")
     db.initialize_database()
+    return db
 
-    yield db
 
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
-    reset_db_instance()
+@pytest.fixture
+def service(db_rollback):
+    """Create an ExerciseService whose writes are rolled back after each test."""
+    return ExerciseService(db_rollback)
 
 
-@pytest.fixture
-def service(temp_db):
-    """Create an ExerciseService with a test database."""
-    return ExerciseService(temp_db)
+def _insert_exercises(db: DatabaseManager, rows: list[tuple[str, str, str, str]]) -> None:
+    """Insert (name, category, primary_muscle, equipment) rows in one batch, bypassing the service."""
+    db.execute_many(
+        "INSERT INTO exercises (name, category, primary_muscle, secondary_muscles, equipment, "
+        "movement_type, is_custom) VALUES (?, ?, ?, '[]', ?, 'Compound', TRUE)",
+        rows,
+    )
 
 
 @pytest.fixture
@@ -69,16 +61,10 @@ class TestExerciseServiceCreate:
         exercise = service.create(sample_exercise_data)
 
         assert exercise.id is not None
-        assert exercise.name == sample_exercise_data.name
-        assert exercise.category == sample_exercise_data.category
-        assert exercise.primary_muscle == sample_exercise_data.primary_muscle
-        assert len(exercise.secondary_muscles) == 2
-        assert exercise.equipment == sample_exercise_data.equipment
-        assert exercise.movement_type == sample_exercise_data.movement_type
-        assert exercise.is_custom is True
-        assert exercise.instructions == sample_exercise_data.instructions
-        assert exercise.video_url == sample_exercise_data.video_url
         assert exercise.created_at is not None
+        assert (
+            exercise.model_dump(exclude={"id", "created_at"}) == sample_exercise_data.model_dump()
+        )
 
     def test_create_duplicate_exercise_fails(self, service, sample_exercise_data):
         """Test that creating a duplicate exercise raises an error."""
@@ -87,6 +73,30 @@ class TestExerciseServiceCreate:
         with pytest.raises(ValueError, match="already exists"):
             service.create(sample_exercise_data)
 
+    def test_create_many(self, service, sample_exercise_data):
+        """Test creating several exercises at once."""
+        second = sample_exercise_data.model_copy(update={"name": "Test Incline Press"})
+
+        assert service.create_many([sample_exercise_data, second]) == 2
+        assert service.get_by_name("Test Incline Press") is not None
+        assert len(service.get_by_name("Test Bench Press").secondary_muscles) == 2
+
+    def test_create_many_duplicate_fails(self, service, sample_exercise_data):
+        """Test that create_many rejects names that already exist."""
+        service.create(sample_exercise_data)
+
+        with pytest.raises(ValueError, match="already exists"):
+            service.create_many([sample_exercise_data])
+
+    def test_create_many_duplicate_in_batch_fails(self, service, sample_exercise_data):
+        """Test that create_many rejects a name repeated within the batch."""
+        repeat = sample_exercise_data.model_copy(update={"name": "test bench press"})
+
+        with pytest.raises(ValueError, match="listed more than once"):
+            service.create_many([sample_exercise_data, repeat])
+
+        assert service.get_by_name("Test Bench Press") is None
+
     def test_create_exercise_without_optional_fields(self, service):
         """Test creating an exercise without optional fields."""
         exercise_data = ExerciseCreate(
@@ -133,14 +143,12 @@ class TestExerciseServiceRead:
         assert retrieved is not None
         assert retrieved.name == "Test Bench Press"
 
-    def test_get_by_name_case_insensitive(self, service, sample_exercise_data):
-        """Test that name search is case-insensitive."""
+    @pytest.mark.parametrize("name", ["test bench press", "TEST BENCH PRESS", "TeSt BeNcH pReSs"])
+    def test_get_by_name_case_insensitive(self, service, sample_exercise_data, name):
+        """Test that name lookup is case-insensitive."""
         service.create(sample_exercise_data)
 
-        # Test various cases
-        assert service.get_by_name("test bench press") is not None
-        assert service.get_by_name("TEST BENCH PRESS") is not None
-        assert service.get_by_name("TeSt BeNcH pReSs") is not None
+        assert service.get_by_name(name) is not None
 
     def test_get_by_name_not_found(self, service):
         """Test retrieving a non-existent exercise by name."""
@@ -149,190 +157,52 @@ class TestExerciseServiceRead:
 
     def test_get_all(self, service):
         """Test retrieving all exercises."""
-        # Create multiple exercises
-        for i in range(3):
-            exercise_data = ExerciseCreate(
-                name=f"Exercise {i}",
-                category=CategoryType.PUSH,
-                primary_muscle=MuscleGroup.CHEST,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            )
-            service.create(exercise_data)
+        _insert_exercises(
+            service.db, [(f"Exercise {i}", "Push", "Chest", "Barbell") for i in range(3)]
+        )
 
         exercises = service.get_all()
         assert len(exercises) == 3
 
-    def test_get_all_with_category_filter(self, service):
-        """Test filtering exercises by category."""
-        # Create exercises with different categories
-        push_exercise = ExerciseCreate(
-            name="Push Exercise",
-            category=CategoryType.PUSH,
-            primary_muscle=MuscleGroup.CHEST,
-            secondary_muscles=[],
-            equipment=EquipmentType.BARBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-        pull_exercise = ExerciseCreate(
-            name="Pull Exercise",
-            category=CategoryType.PULL,
-            primary_muscle=MuscleGroup.BACK,
-            secondary_muscles=[],
-            equipment=EquipmentType.BARBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-
-        service.create(push_exercise)
-        service.create(pull_exercise)
-
-        # Filter by Push
-        push_exercises = service.get_all(category="Push")
-        assert len(push_exercises) == 1
-        assert push_exercises[0].name == "Push Exercise"
-
-        # Filter by Pull
-        pull_exercises = service.get_all(category="Pull")
-        assert len(pull_exercises) == 1
-        assert pull_exercises[0].name == "Pull Exercise"
-
-    def test_get_all_with_muscle_filter(self, service):
-        """Test filtering exercises by muscle group."""
-        chest_exercise = ExerciseCreate(
-            name="Chest Exercise",
-            category=CategoryType.PUSH,
-            primary_muscle=MuscleGroup.CHEST,
-            secondary_muscles=[],
-            equipment=EquipmentType.BARBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-        back_exercise = ExerciseCreate(
-            name="Back Exercise",
-            category=CategoryType.PULL,
-            primary_muscle=MuscleGroup.BACK,
-            secondary_muscles=[],
-            equipment=EquipmentType.BARBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-
-        service.create(chest_exercise)
-        service.create(back_exercise)
-
-        # Filter by Chest
-        chest_exercises = service.get_all(muscle="Chest")
-        assert len(chest_exercises) == 1
-        assert chest_exercises[0].name == "Chest Exercise"
-
-    def test_get_all_with_equipment_filter(self, service):
-        """Test filtering exercises by equipment."""
-        barbell_exercise = ExerciseCreate(
-            name="Barbell Exercise",
-            category=CategoryType.PUSH,
-            primary_muscle=MuscleGroup.CHEST,
-            secondary_muscles=[],
-            equipment=EquipmentType.BARBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-        dumbbell_exercise = ExerciseCreate(
-            name="Dumbbell Exercise",
-            category=CategoryType.PUSH,
-            primary_muscle=MuscleGroup.CHEST,
-            secondary_muscles=[],
-            equipment=EquipmentType.DUMBBELL,
-            movement_type=MovementType.COMPOUND,
-            is_custom=True,
-        )
-
-        service.create(barbell_exercise)
-        service.create(dumbbell_exercise)
-
-        # Filter by Barbell
-        barbell_exercises = service.get_all(equipment="Barbell")
-        assert len(barbell_exercises) == 1
-        assert barbell_exercises[0].name == "Barbell Exercise"
-
-    def test_get_all_with_multiple_filters(self, service):
-        """Test filtering with multiple criteria."""
-        # Create exercises
-        exercises_data = [
-            ExerciseCreate(
-                name="Barbell Bench Press",
-                category=CategoryType.PUSH,
-                primary_muscle=MuscleGroup.CHEST,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
+    @pytest.mark.parametrize(
+        ("filters", "expected_names"),
+        [
+            ({"category": "Push"}, {"Barbell Bench Press", "Dumbbell Fly"}),
+            ({"category": "Pull"}, {"Barbell Row"}),
+            ({"muscle": "Chest"}, {"Barbell Bench Press", "Dumbbell Fly"}),
+            ({"muscle": "Back"}, {"Barbell Row"}),
+            ({"equipment": "Barbell"}, {"Barbell Bench Press", "Barbell Row"}),
+            ({"equipment": "Dumbbell"}, {"Dumbbell Fly"}),
+            (
+                {"category": "Push", "muscle": "Chest", "equipment": "Barbell"},
+                {"Barbell Bench Press"},
             ),
-            ExerciseCreate(
-                name="Dumbbell Bench Press",
-                category=CategoryType.PUSH,
-                primary_muscle=MuscleGroup.CHEST,
-                secondary_muscles=[],
-                equipment=EquipmentType.DUMBBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            ),
-            ExerciseCreate(
-                name="Barbell Row",
-                category=CategoryType.PULL,
-                primary_muscle=MuscleGroup.BACK,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            ),
-        ]
-
-        for exercise_data in exercises_data:
-            service.create(exercise_data)
+        ],
+    )
+    def test_get_all_with_filters(self, service, filters, expected_names):
+        """Test filtering exercises by category, muscle and equipment."""
+        _insert_exercises(
+            service.db,
+            [
+                ("Barbell Bench Press", "Push", "Chest", "Barbell"),
+                ("Dumbbell Fly", "Push", "Chest", "Dumbbell"),
+                ("Barbell Row", "Pull", "Back", "Barbell"),
+            ],
+        )
 
-        # Filter: Push + Chest + Barbell
-        filtered = service.get_all(category="Push", muscle="Chest", equipment="Barbell")
-        assert len(filtered) == 1
-        assert filtered[0].name == "Barbell Bench Press"
+        exercises = service.get_all(**filters)
+        assert {ex.name for ex in exercises} == expected_names
 
     def test_search(self, service):
         """Test searching exercises by name."""
-        exercises_data = [
-            ExerciseCreate(
-                name="Barbell Bench Press",
-                category=CategoryType.PUSH,
-                primary_muscle=MuscleGroup.CHEST,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            ),
-            ExerciseCreate(
-                name="Incline Bench Press",
-                category=CategoryType.PUSH,
-                primary_muscle=MuscleGroup.CHEST,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            ),
-            ExerciseCreate(
-                name="Barbell Row",
-                category=CategoryType.PULL,
-                primary_muscle=MuscleGroup.BACK,
-                secondary_muscles=[],
-                equipment=EquipmentType.BARBELL,
-                movement_type=MovementType.COMPOUND,
-                is_custom=True,
-            ),
-        ]
-
-        for exercise_data in exercises_data:
-            service.create(exercise_data)
+        _insert_exercises(
+            service.db,
+            [
+                ("Barbell Bench Press", "Push", "Chest", "Barbell"),
+                ("Incline Bench Press", "Push", "Chest", "Barbell"),
+                ("Barbell Row", "Pull", "Back", "Barbell"),
+            ],
+        )
 
         # Search for "bench"
         results = service.search("bench")
@@ -343,13 +213,12 @@ class TestExerciseServiceRead:
         results = service.search("barbell")
         assert len(results) == 2
 
-    def test_search_case_insensitive(self, service, sample_exercise_data):
+    @pytest.mark.parametrize("query", ["bench", "BENCH", "BeNcH"])
+    def test_search_case_insensitive(self, service, sample_exercise_data, query):
         """Test that search is case-insensitive."""
         service.create(sample_exercise_data)
 
-        assert len(service.search("bench")) > 0
-        assert len(service.search("BENCH")) > 0
-        assert len(service.search("BeNcH")) > 0
+        assert len(service.search(query)) > 0
 
 
 class TestExerciseServiceDelete:
@@ -418,34 +287,12 @@ class TestExerciseServiceSeedData:
         ]
 
         json_file = tmp_path / "test_exercises.json"
-        with open(json_file, "w") as f:
-            json.dump(seed_data, f)
-
-        # Temporarily replace the exercises.json path
-        original_path = Path(__file__).parent.parent / "lift" / "data" / "exercises.json"
-        import shutil
-
-        # Backup if exists
-        backup_path = None
-        if original_path.exists():
-            backup_path = original_path.with_suffix(".json.backup")
-            shutil.copy(original_path, backup_path)
-
-        try:
-            # Copy test file to expected location
-            original_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(json_file, original_path)
+        json_file.write_bytes(orjson.dumps(seed_data))
 
-            # Load seed data
-            loaded_count = service.load_seed_exercises()
+        loaded_count = service.load_seed_exercises(exercises_file=str(json_file))
 
-            assert loaded_count == 2
-            assert len(service.get_all()) == 2
-
-        finally:
-            # Restore backup
-            if backup_path and backup_path.exists():
-                shutil.move(backup_path, original_path)
+        assert loaded_count == 2
+        assert len(service.get_all()) == 2
 
     def test_load_seed_exercises_skips_if_exists(self, service, sample_exercise_data):
         """Test that seed loading is skipped if exercises already exist."""
@@ -488,27 +335,10 @@ class TestExerciseServiceSeedData:
         ]
 
         json_file = tmp_path / "test_exercises.json"
-        with open(json_file, "w") as f:
-            json.dump(seed_data, f)
-
-        original_path = Path(__file__).parent.parent / "lift" / "data" / "exercises.json"
-        import shutil
-
-        backup_path = None
-        if original_path.exists():
-            backup_path = original_path.with_suffix(".json.backup")
-            shutil.copy(original_path, backup_path)
-
-        try:
-            original_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(json_file, original_path)
-
-            # Force reload should load the new exercise
-            loaded_count = service.load_seed_exercises(force=True)
+        json_file.write_bytes(orjson.dumps(seed_data))
 
-            assert loaded_count == 1
-            assert len(service.get_all()) == 2  # Initial + new seed
+        # Force reload should load the new exercise
+        loaded_count = service.load_seed_exercises(force=True, exercises_file=str(json_file))
 
-        finally:
-            if backup_path and backup_path.exists():
-                shutil.move(backup_path, original_path)
+        assert loaded_count == 1
+        assert len(service.get_all()) == 2  # Initial + new seed
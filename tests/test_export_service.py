@@ -1,158 +1,163 @@
 """Tests for export service."""
 
-import json
-import tempfile
-from pathlib import Path
+import io
 
+import orjson
 import pytest
 
-from lift.core.database import DatabaseManager, reset_db_instance
+from lift.core.database import DatabaseManager
 from lift.services.export_service import ExportService
 
 
-@pytest.fixture
-def db():
-    """Create a temporary test database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.duckdb"
-        reset_db_instance()
-        db = DatabaseManager(str(db_path))
-        db.initialize_database()
-
-        # Add some test data
-        with db.get_connection() as conn:
-            # Insert test exercise
-            conn.execute(
-                """
-                INSERT INTO exercises (name, category, primary_muscle, equipment, movement_type)
-                VALUES ('Bench Press', 'Push', 'Chest', 'Barbell', 'Compound')
-                """
-            )
-
-            # Insert test setting
-            conn.execute(
-                """
-                INSERT INTO settings (key, value, description)
-                VALUES ('test_key', 'test_value', 'Test setting')
-                """
-            )
-
-        yield db
-        reset_db_instance()
-
-
-def test_export_to_csv(db):
-    """Test exporting a single table to CSV."""
-    export_service = ExportService(db)
+@pytest.fixture(scope="module")
+def db() -> DatabaseManager:
+    """Create one in-memory test database with sample rows, shared by the whole module."""
+    db = DatabaseManager(":memory:")
+    db.initialize_database()
+
+    # Add a test exercise and setting in one multi-statement script
+    with db.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO exercises (name, category, primary_muscle, equipment, movement_type)
+            VALUES ('Bench Press', 'Push', 'Chest', 'Barbell', 'Compound');
+
+            INSERT INTO settings (key, value, description)
+            VALUES ('test_key', 'test_value', 'Test setting');
+            """
+        )
+
+    return db
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "exercises.csv"
-        export_service.export_to_csv("exercises", str(output_path))
 
-        # Verify file exists
-        assert output_path.exists()
+@pytest.fixture(scope="module")
+def export_service(db: DatabaseManager) -> ExportService:
+    """Create one export service shared by every test in this module."""
+    return ExportService(db)
 
-        # Verify content
-        with open(output_path) as f:
-            lines = f.readlines()
-            assert len(lines) >= 2  # Header + at least 1 data row
-            assert "name" in lines[0].lower()
-            assert "Bench Press" in lines[1]
 
+@pytest.fixture(autouse=True)
+def _rollback(db_rollback):
+    """Roll back each test's writes so the shared database stays unchanged."""
 
-def test_export_all_to_csv(db):
+
+def test_export_to_csv(db, export_service, tmp_path):
+    """Test exporting a single table to CSV."""
+    output_path = tmp_path / "exercises.csv"
+    export_service.export_to_csv("exercises", str(output_path))
+
+    # Verify file exists
+    assert output_path.exists()
+
+    # Verify content by reading it back with DuckDB's CSV reader
+    with db.get_connection() as conn:
+        row_count, first_name = conn.execute(
+            "SELECT COUNT(*), first(name) FROM read_csv_auto(?)", [str(output_path)]
+        ).fetchone()
+    assert row_count >= 1
+    assert first_name == "Bench Press"
+
+
+def test_export_all_to_csv(db, export_service, tmp_path):
     """Test exporting all tables to CSV."""
-    export_service = ExportService(db)
+    summary = export_service.export_all_to_csv(str(tmp_path))
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        summary = export_service.export_all_to_csv(tmpdir)
+    # Verify summary
+    assert isinstance(summary, dict)
+    assert "exercises" in summary
+    assert "settings" in summary
+    assert summary["exercises"] >= 1
 
-        # Verify summary
-        assert isinstance(summary, dict)
-        assert "exercises" in summary
-        assert "settings" in summary
-        assert summary["exercises"] >= 1
+    # Verify files exist and hold every exported row
+    exercises_file = tmp_path / "exercises.csv"
+    assert exercises_file.exists()
 
-        # Verify files exist
-        exercises_file = Path(tmpdir) / "exercises.csv"
-        assert exercises_file.exists()
+    with db.get_connection() as conn:
+        row_count = conn.execute(
+            "SELECT COUNT(*) FROM read_csv_auto(?)", [str(exercises_file)]
+        ).fetchone()[0]
+    assert row_count == summary["exercises"]
 
 
-def test_export_to_json(db):
+def test_export_to_json(db, export_service, tmp_path):
     """Test exporting a single table to JSON."""
-    export_service = ExportService(db)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "exercises.json"
-        export_service.export_to_json("exercises", str(output_path))
+    output_path = tmp_path / "exercises.json"
+    export_service.export_to_json("exercises", str(output_path))
 
-        # Verify file exists
-        assert output_path.exists()
+    # Verify file exists
+    assert output_path.exists()
 
-        # Verify content
-        with open(output_path) as f:
-            data = json.load(f)
-            assert isinstance(data, list)
-            assert len(data) >= 1
-            assert data[0]["name"] == "Bench Press"
+    # Verify content by reading it back with DuckDB's JSON reader
+    with db.get_connection() as conn:
+        row_count, first_name = conn.execute(
+            "SELECT COUNT(*), first(name) FROM read_json_auto(?)", [str(output_path)]
+        ).fetchone()
+    assert row_count >= 1
+    assert first_name == "Bench Press"
 
 
-def test_export_all_to_json(db):
+def test_export_all_to_json(db, export_service, tmp_path):
     """Test exporting all tables to a single JSON file."""
-    export_service = ExportService(db)
+    output_path = tmp_path / "database.json"
+    summary = export_service.export_all_to_json(str(output_path))
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "database.json"
-        summary = export_service.export_all_to_json(str(output_path))
+    # Verify summary
+    assert isinstance(summary, dict)
+    assert "exercises" in summary
+    assert "settings" in summary
+    assert summary["exercises"] >= 1
 
-        # Verify summary
-        assert isinstance(summary, dict)
-        assert "exercises" in summary
-        assert "settings" in summary
-        assert summary["exercises"] >= 1
+    # Verify file exists and content
+    assert output_path.exists()
 
-        # Verify file exists and content
-        assert output_path.exists()
+    with db.get_connection() as conn:
+        has_export_date, exercise_count = conn.execute(
+            "SELECT export_date IS NOT NULL, len(tables.exercises) FROM read_json_auto(?)",
+            [str(output_path)],
+        ).fetchone()
+    assert has_export_date
+    assert exercise_count == summary["exercises"]
 
-        with open(output_path) as f:
-            data = json.load(f)
-            assert "export_date" in data
-            assert "tables" in data
-            assert "exercises" in data["tables"]
-            assert len(data["tables"]["exercises"]) >= 1
 
+def test_export_json_streams(export_service):
+    """Test exporting JSON to in-memory text streams."""
+    buf = io.StringIO()
+    export_service.export_to_json_stream("exercises", buf)
+    assert orjson.loads(buf.getvalue())[0]["name"] == "Bench Press"
 
-def test_export_nonexistent_table(db):
-    """Test exporting a table that doesn't exist."""
-    export_service = ExportService(db)
+    buf = io.StringIO()
+    summary = export_service.export_all_to_json_stream(buf)
+    data = orjson.loads(buf.getvalue())
+    assert len(data["tables"]["exercises"]) == summary["exercises"]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "nonexistent.csv"
+    # Same indented layout and ISO timestamps as the single-table exports
+    assert buf.getvalue() == orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    assert "T" in data["tables"]["exercises"][0]["created_at"]
 
-        with pytest.raises(ValueError, match="does not exist"):
-            export_service.export_to_csv("nonexistent_table", str(output_path))
 
+def test_export_nonexistent_table(export_service, tmp_path):
+    """Test exporting a table that doesn't exist."""
+    output_path = tmp_path / "nonexistent.csv"
+
+    with pytest.raises(ValueError, match="does not exist"):
+        export_service.export_to_csv("nonexistent_table", str(output_path))
 
-def test_export_empty_table(db):
-    """Test exporting an empty table."""
-    export_service = ExportService(db)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "workouts.csv"
-        export_service.export_to_csv("workouts", str(output_path))
+def test_export_empty_table(export_service, tmp_path):
+    """Test exporting an empty table."""
+    output_path = tmp_path / "workouts.csv"
+    export_service.export_to_csv("workouts", str(output_path))
 
-        # Verify file exists with headers only
-        assert output_path.exists()
+    # Verify file exists with headers only
+    assert output_path.exists()
 
-        with open(output_path) as f:
-            lines = f.readlines()
-            assert len(lines) == 1  # Header only
+    with open(output_path) as f:
+        lines = f.readlines()
+        assert len(lines) == 1  # Header only
 
 
-def test_export_workout_history(db):
+def test_export_workout_history(db, export_service, tmp_path):
     """Test exporting workout history."""
-    export_service = ExportService(db)
-
     # Add a test workout
     with db.get_connection() as conn:
         conn.execute(
@@ -162,32 +167,27 @@ def test_export_workout_history(db):
             """
         )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "workout_history.json"
-        count = export_service.export_workout_history(output_path=str(output_path))
+    output_path = tmp_path / "workout_history.json"
+    count = export_service.export_workout_history(output_path=str(output_path))
 
-        # Verify count
-        assert count >= 1
+    # Verify count
+    assert count >= 1
 
-        # Verify file exists and content
-        assert output_path.exists()
+    # Verify file exists and content
+    assert output_path.exists()
 
-        with open(output_path) as f:
-            data = json.load(f)
-            assert "workouts" in data
-            assert "workout_count" in data
-            assert data["workout_count"] >= 1
+    data = orjson.loads(output_path.read_bytes())
+    assert "workouts" in data
+    assert "workout_count" in data
+    assert data["workout_count"] >= 1
 
 
-def test_export_creates_directories(db):
+def test_export_creates_directories(export_service, tmp_path):
     """Test that export creates necessary directories."""
-    export_service = ExportService(db)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Use a nested path that doesn't exist
-        output_path = Path(tmpdir) / "nested" / "path" / "exercises.csv"
-        export_service.export_to_csv("exercises", str(output_path))
+    # Use a nested path that doesn't exist
+    output_path = tmp_path / "nested" / "path" / "exercises.csv"
+    export_service.export_to_csv("exercises", str(output_path))
 
-        # Verify directory and file were created
-        assert output_path.exists()
-        assert output_path.parent.exists()
+    # Verify directory and file were created
+    assert output_path.exists()
+    assert output_path.parent.exists()
@@ -7,20 +7,21 @@ from pathlib import Path
 
 import pytest
 
-from lift.core.database import DatabaseManager, reset_db_instance
+from lift.core.database import DatabaseManager
 from lift.services.import_service import ImportService
 
 
-@pytest.fixture
-def db():
-    """Create a temporary test database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.duckdb"
-        reset_db_instance()
-        db = DatabaseManager(str(db_path))
-        db.initialize_database()
-        yield db
-        reset_db_instance()
+@pytest.fixture(scope="module")
+def db() -> DatabaseManager:
+    """Create one in-memory test database shared by every test in this module."""
+    db = DatabaseManager(":memory:")
+    db.initialize_database()
+    return db
+
+
+@pytest.fixture(autouse=True)
+def _rollback(db_rollback):
+    """Roll back each test's writes so the shared database stays unchanged."""
 
 
 def test_import_from_csv(db):
@@ -259,6 +260,80 @@ def test_import_csv_with_null_values(db):
             assert result[0] is None
 
 
+@pytest.mark.parametrize(
+    ("row", "match"),
+    [
+        (["Squat", "", "Quads", "Barbell", "true"], "'category' is empty"),
+        (["Squat", "Legs", "Quads", "Barbell", "maybe"], "'is_custom' is not a valid BOOLEAN"),
+    ],
+)
+def test_import_csv_invalid_rows(db, tmp_path, row, match):
+    """Test that rows are validated before anything is imported."""
+    import_service = ImportService(db)
+
+    csv_path = tmp_path / "exercises.csv"
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "category", "primary_muscle", "equipment", "is_custom"])
+        writer.writerow(["Deadlift", "Pull", "Back", "Barbell", "false"])
+        writer.writerow(row)
+
+    with pytest.raises(ValueError, match=match):
+        import_service.import_from_csv("exercises", str(csv_path))
+
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM exercises").fetchone()[0] == 0
+
+
+def test_import_exercises_partial_keys_use_column_defaults(db, tmp_path):
+    """Test that keys missing from some exercises get the column default, not NULL."""
+    import_service = ImportService(db)
+
+    base = {"category": "Push", "primary_muscle": "Chest", "equipment": "Barbell"}
+    json_path = tmp_path / "exercises.json"
+    json_path.write_text(
+        json.dumps(
+            [
+                {**base, "name": "Bench Press", "id": 50, "is_custom": True},
+                {**base, "name": "Dip"},
+            ]
+        )
+    )
+
+    assert import_service.import_exercises_from_json(str(json_path)) == 2
+
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, is_custom, created_at FROM exercises WHERE name = 'Dip'"
+        ).fetchone()
+    assert row[0] is not None
+    assert row[1] is False
+    assert row[2] is not None
+
+
+def test_import_exercises_type_mismatch(db, tmp_path):
+    """Test that a field of the wrong type raises ValueError naming the file."""
+    import_service = ImportService(db)
+
+    json_path = tmp_path / "exercises.json"
+    json_path.write_text(
+        json.dumps(
+            [
+                {
+                    "name": "Bench Press",
+                    "category": "Push",
+                    "primary_muscle": "Chest",
+                    "equipment": "Barbell",
+                    "is_custom": "yes",
+                }
+            ]
+        )
+    )
+
+    with pytest.raises(ValueError, match=r"Invalid exercise data in exercises\.json"):
+        import_service.import_exercises_from_json(str(json_path))
+
+
 def test_import_exercises_missing_required_field(db):
     """Test importing exercises with missing required fields."""
     import_service = ImportService(db)
@@ -31,12 +31,13 @@ from lift.services.stats_service import StatsService
 from lift.services.workout_service import WorkoutService
 
 
-@pytest.fixture
-def loaded_db(db: DatabaseManager) -> DatabaseManager:
-    """Database with exercises and config pre-loaded."""
-    exercise_service = ExerciseService(db)
+@pytest.fixture(scope="module")
+def db() -> DatabaseManager:
+    """Create one in-memory database with exercises pre-loaded, shared by the whole module."""
+    db = DatabaseManager(":memory:")
+    db.initialize_database()
 
-    # Load 5 basic exercises
+    # Load 5 basic exercises with one multi-row insert
     exercises = [
         ("Bench Press", CategoryType.PUSH, MuscleGroup.CHEST, EquipmentType.BARBELL),
         ("Squat", CategoryType.LEGS, MuscleGroup.QUADS, EquipmentType.BARBELL),
@@ -45,8 +46,8 @@ def loaded_db(db: DatabaseManager) -> DatabaseManager:
         ("Barbell Row", CategoryType.PULL, MuscleGroup.BACK, EquipmentType.BARBELL),
     ]
 
-    for name, category, muscle, equipment in exercises:
-        exercise_service.create(
+    ExerciseService(db).create_many(
+        [
             ExerciseCreate(
                 name=name,
                 category=category,
@@ -54,11 +55,19 @@ def loaded_db(db: DatabaseManager) -> DatabaseManager:
                 equipment=equipment,
                 movement_type=MovementType.COMPOUND,
             )
-        )
+            for name, category, muscle, equipment in exercises
+        ]
+    )
 
     return db
 
 
+@pytest.fixture
+def loaded_db(db_rollback: DatabaseManager) -> DatabaseManager:
+    """Database with exercises pre-loaded; each test's writes are rolled back."""
+    return db_rollback
+
+
 class TestConfigServiceIntegration:
     """Test how configuration affects other services."""
 
@@ -301,8 +310,8 @@ class TestWorkoutPRIntegration:
         # First workout - moderate volume
         workout1 = workout_service.create_workout(WorkoutCreate(name="Leg Day 1"))
 
-        for i in range(1, 4):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout1.id,
                     exercise_id=squat.id,
@@ -311,15 +320,17 @@ class TestWorkoutPRIntegration:
                     reps=8,
                     set_type=SetType.WORKING,
                 )
-            )
+                for i in range(1, 4)
+            ]
+        )
 
         prs1 = pr_service.auto_detect_prs(workout1.id)
 
         # Second workout - higher volume (more reps)
         workout2 = workout_service.create_workout(WorkoutCreate(name="Leg Day 2"))
 
-        for i in range(1, 4):
-            set_service.add_set(
+        set_service.add_sets(
+            [
                 SetCreate(
                     workout_id=workout2.id,
                     exercise_id=squat.id,
@@ -328,7 +339,9 @@ class TestWorkoutPRIntegration:
                     reps=12,  # More reps = more volume
                     set_type=SetType.WORKING,
                 )
-            )
+                for i in range(1, 4)
+            ]
+        )
 
         prs2 = pr_service.auto_detect_prs(workout2.id)
 
@@ -529,8 +542,8 @@ class TestMultiWeekProgression:
             )
 
             # Log 3 sets
-            for set_num in range(1, 4):
-                set_service.add_set(
+            set_service.add_sets(
+                [
                     SetCreate(
                         workout_id=workout.id,
                         exercise_id=bench.id,
@@ -540,7 +553,9 @@ class TestMultiWeekProgression:
                         rpe=Decimal("8.0"),
                         set_type=SetType.WORKING,
                     )
-                )
+                    for set_num in range(1, 4)
+                ]
+            )
 
             workout_service.finish_workout(workout.id, duration_minutes=60)
 
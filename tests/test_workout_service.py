@@ -113,6 +113,12 @@ class TestWorkoutService:
         assert last_workout is not None
         assert last_workout.name == "Workout 2"
 
+    def test_queries_on_empty_database(self, workout_service):
+        """Test listing queries return nothing when no workouts exist."""
+        assert workout_service.get_recent_workouts() == []
+        assert workout_service.get_last_workout() is None
+        assert workout_service.get_incomplete_workouts() == []
+
     def test_update_workout(self, workout_service, sample_workout):
         """Test updating a workout."""
         update = WorkoutUpdate(
@@ -307,6 +313,42 @@ class TestSetService:
         assert sets[0].set_number == 1
         assert sets[-1].set_number == 4
 
+    def test_add_sets(self, set_service, sample_workout, db):
+        """Test adding several sets in one batch."""
+        # Create exercise
+        with db.get_connection() as conn:
+            result = conn.execute(
+                """
+                INSERT INTO exercises (name, category, primary_muscle, equipment, movement_type)
+                VALUES ('Squat', 'Legs', 'Quads', 'Barbell', 'Compound')
+                RETURNING id
+                """
+            ).fetchone()
+            exercise_id = result[0]
+
+        sets_data = [(Decimal("225"), 8), (Decimal("245"), 6), (Decimal("265"), 4)]
+        added = set_service.add_sets(
+            [
+                SetCreate(
+                    workout_id=sample_workout.id,
+                    exercise_id=exercise_id,
+                    set_number=i,
+                    weight=weight,
+                    reps=reps,
+                )
+                for i, (weight, reps) in enumerate(sets_data, 1)
+            ]
+        )
+
+        assert added == 3
+        assert set_service.add_sets([]) == 0
+
+        sets = set_service.get_sets_for_workout(sample_workout.id)
+        assert [(s.set_number, s.weight, s.reps) for s in sets] == [
+            (i, weight, reps) for i, (weight, reps) in enumerate(sets_data, 1)
+        ]
+        assert all(s.set_type == SetType.WORKING for s in sets)
+
     def test_calculate_volume(self, set_service, sample_workout, db):
         """Test volume calculation."""
         # Create exercise